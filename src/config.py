@@ -84,6 +84,28 @@ class TextQualityConfig(BaseModel):
     max_words: int = Field(default=50000, ge=1, description="Maximum word count")
     min_avg_word_length: float = Field(default=3.0, ge=0.0, description="Minimum average word length")
     language: str = Field(default="en", description="Target language code")
+    regex_backend: Literal["re", "re2"] = Field(
+        default="re",
+        description="Regex engine for word tokenization (re2 = google-re2 DFA, falls back to re if not installed)"
+    )
+    fasttext_lid_model_path: Optional[str] = Field(
+        default=None,
+        description="Path to fastText language-ID model (lid.176.ftz/.bin). If None, lingua or langdetect is used."
+    )
+    language_detection_max_words: int = Field(
+        default=300,
+        ge=10,
+        description="Only the first N words of a document are used for language detection"
+    )
+    verbose_stats: bool = Field(
+        default=False,
+        description="Include diagnostic repetition stats (most repeated word/n-gram, etc.) for passing documents too"
+    )
+    filter_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description="Filter results cached by document content hash, so exact duplicates are not re-filtered (0 = disabled)"
+    )
 
     # Repetition filter settings
     max_char_repetition_ratio: float = Field(
@@ -164,8 +186,8 @@ class ImageQualityConfig(BaseModel):
         description="Enable duplicate/near-duplicate image detection"
     )
     duplicate_hash_algorithm: Literal["phash", "dhash", "whash", "average_hash"] = Field(
-        default="phash",
-        description="Perceptual hash algorithm to use (phash=perceptual, dhash=difference, whash=wavelet, average_hash=average)"
+        default="dhash",
+        description="Perceptual hash algorithm to use (dhash=difference, fastest; phash=perceptual, DCT-based; whash=wavelet; average_hash=average)"
     )
     duplicate_similarity_threshold: int = Field(
         default=5,
@@ -178,6 +200,15 @@ class ImageQualityConfig(BaseModel):
         ge=2,
         description="Minimum number of images required to perform duplicate detection"
     )
+    hash_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Threads computing perceptual hashes in parallel (None = CPU count)"
+    )
+    hash_cache_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file caching perceptual hashes by (path, mtime, size, algorithm); None disables (opt-in)"
+    )
 
     @field_validator("min_resolution")
     @classmethod
@@ -196,6 +227,33 @@ class AlignmentConfig(BaseModel):
         le=1.0,
         description="Minimum CLIP similarity score for text-image alignment"
     )
+    compile_model: bool = Field(
+        default=True,
+        description="Compile CLIP feature extractors with torch.compile (CUDA only, falls back to eager on failure)"
+    )
+    backend: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description="Inference backend for CLIP features (torch=PyTorch, onnx=ONNX Runtime)"
+    )
+    onnx_model_dir: str = Field(
+        default="data/cache/clip_onnx",
+        description="Directory holding exported CLIP ONNX graphs (exported on first use if missing)"
+    )
+    batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Number of images per CLIP forward pass"
+    )
+    num_decode_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Threads decoding/preprocessing images ahead of CLIP inference"
+    )
+    image_feature_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description="Image embeddings kept by content hash so images shared across pages are encoded once (0=disabled)"
+    )
 
 
 class NERConfig(BaseModel):
@@ -332,6 +390,14 @@ class ProcessingConfig(BaseModel):
     num_workers: int = Field(default=4, ge=1, description="Number of worker processes")
 
 
+class OutputConfig(BaseModel):
+    """Processed output configuration."""
+    keep_raw_html: bool = Field(
+        default=False,
+        description="Store the fetched page HTML in each processed record (raw_html field)"
+    )
+
+
 class LoggingConfig(BaseModel):
     """Logging configuration."""
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -412,6 +478,7 @@ class Config(BaseModel):
     quality: QualityConfig = Field(default_factory=QualityConfig)
     enrichment: EnrichmentConfig = Field(default_factory=EnrichmentConfig)
     processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
+    output: OutputConfig = Field(default_factory=OutputConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     clickhouse: ClickHouseConfig = Field(default_factory=ClickHouseConfig)
     workflow: WorkflowConfig = Field(default_factory=WorkflowConfig)
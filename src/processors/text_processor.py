@@ -1,5 +1,7 @@
+import functools
 import json
 import pathlib
+import re
 from datetime import datetime
 import os
 import logging
@@ -14,6 +16,13 @@ from src.quality.alignment import CLIPAlignmentScorer
 from src.enrichment.enricher import EnrichmentPipeline
 from src.enrichment.captioner import BLIP2Captioner
 
+# Prefer orjson for JSONL (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load validated config
 config = get_config()
 
@@ -25,6 +34,9 @@ MIN_WORDS = int(os.getenv("MIN_WORDS", str(config.quality.text.min_words)))
 RAW_PATH = ROOT / "data" / "raw" / "seed_pages.jsonl"
 OUT_PATH = ROOT / "data" / "processed" / "cleaning_docs.jsonl"
 
+# Write buffer for the output JSONL (1 MiB)
+OUT_BUFFER_SIZE = 1 << 20
+
 # Setup logging from config
 log_level = getattr(logging, config.logging.level.upper(), logging.INFO)
 logging.basicConfig(
@@ -34,16 +46,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _loads(line: bytes) -> dict:
+    """Parse one JSONL line."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps_line(record: dict) -> bytes:
+    """Serialize a record to one UTF-8 encoded JSONL line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# URL substring -> source type (legacy domain table)
+SOURCE_TYPE_DOMAINS = {
+    "puffy.com": "pillows_bedding",
+    "maidbrigade.com": "pillows_bedding",
+    "whirlpool.com": "clothes",
+    "ariel.in": "clothes",
+    "cleaninginstitute.org": "clothes",
+    "vanish.co.in": "carpets_floors",
+    "floorworld.com.au": "carpets_floors",
+    "mycleaners.in": "carpets_floors",
+    "spincycles.in": "carpets_floors",
+}
+
+
+def _compile_source_type_patterns() -> list:
+    """One alternation per source type, in table (priority) order."""
+    domains_by_type: dict = {}
+    for domain, source_type in SOURCE_TYPE_DOMAINS.items():
+        domains_by_type.setdefault(source_type, []).append(re.escape(domain))
+    return [
+        (source_type, re.compile("|".join(domains)))
+        for source_type, domains in domains_by_type.items()
+    ]
+
+
+# Checked in priority order (pillows_bedding, clothes, carpets_floors), so a
+# URL naming domains of several types resolves as the legacy checks did
+_SOURCE_TYPE_PATTERNS = _compile_source_type_patterns()
+
+
 def infer_source_type(url: str) -> str:
     """Infer source type from URL (legacy function, kept for backward compatibility)."""
-    if "puffy.com" in url or "maidbrigade.com" in url:
-        return "pillows_bedding"
-    if "whirlpool.com" in url or "ariel.in" in url or "cleaninginstitute.org" in url:
-        return "clothes"
-    if "vanish.co.in" in url or "floorworld.com.au" in url or "mycleaners.in" in url or "spincycles.in" in url:
-        return "carpets_floors"
+    for source_type, pattern in _SOURCE_TYPE_PATTERNS:
+        if pattern.search(url):
+            return source_type
     return "unknown"
 
+
+@functools.cache
+def _get_text_filter() -> TextQualityFilter:
+    """
+    Get the shared text quality filter.
+    
+    The config is fixed for the process, so the filter (and its KenLM
+    model) is built once instead of on every process_url call.
+    """
+    return TextQualityFilter(config.quality.text)
+
+
 def process_url(url: str, title: str, image_urls: list = None, video_urls: list = None, image_details: list = None, video_metadata: list = None) -> dict | None:
     try:
         resp = requests.get(url, timeout=20)
@@ -64,8 +129,7 @@ def process_url(url: str, title: str, image_urls: list = None, video_urls: list
         return None
 
     # Apply text quality filters (includes repetition filter)
-    text_filter = TextQualityFilter(config.quality.text)
-    filter_result = text_filter.filter(main_text)
+    filter_result = _get_text_filter().filter(main_text)
 
     if not filter_result["passed"]:
         reason = filter_result['reason']
@@ -91,7 +155,6 @@ def process_url(url: str, title: str, image_urls: list = None, video_urls: list
         "url": url,
         "title": title,
         "source_type": infer_source_type(url),
-        "raw_html": html,
         "main_text": main_text,
         "language": "en",
         "fetched_at": now_iso,
@@ -102,6 +165,10 @@ def process_url(url: str, title: str, image_urls: list = None, video_urls: list
         "video_metadata": video_metadata or [],
     }
 
+    # Raw HTML is often 10-100x the extracted text, so it is opt-in
+    if config.output.keep_raw_html:
+        base_record["raw_html"] = html
+
     # Note: Image filtering happens later in main() after images are downloaded
     # For now, just store image URLs
     base_record["image_urls"] = image_urls or []
@@ -168,12 +235,15 @@ def main():
         captioner = None
         logger.info("Image captioning disabled in configuration")
 
-    with RAW_PATH.open() as fin, OUT_PATH.open("w", encoding="utf-8") as fout:
+    # Image quality filter depends only on config, build it once
+    image_filter = ImageQualityFilter(config.quality.image)
+
+    with RAW_PATH.open("rb") as fin, OUT_PATH.open("wb", buffering=OUT_BUFFER_SIZE) as fout:
         for line in fin:
             if not line.strip():
                 continue
             total += 1
-            obj = json.loads(line)
+            obj = _loads(line)
             url = obj.get("url")
             title = obj.get("title", "")
             image_urls = obj.get("image_urls", [])
@@ -197,7 +267,6 @@ def main():
             # Apply image quality filters if images metadata is available
             images_metadata = obj.get("images", [])
             if images_metadata:
-                image_filter = ImageQualityFilter(config.quality.image)
                 passed_images, failed_images = image_filter.filter_images(images_metadata)
 
                 # Apply CLIP text-image alignment scoring (Phase-3.7)
@@ -260,7 +329,7 @@ def main():
                         logger.debug(f"  - {failed_img.get('url', 'unknown')}: {reason}")
 
             kept += 1
-            fout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            fout.write(_dumps_line(record))
 
     logger.info(f"Total raw records: {total}")
     logger.info(f"Kept after filtering: {kept}")
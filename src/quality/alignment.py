@@ -6,10 +6,15 @@ the semantic relevance between text content and images. This is a key
 differentiator for multi-modal quality filtering.
 """
 
+import hashlib
+import io
 import logging
 import pathlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 from src.config import AlignmentConfig
 
@@ -26,6 +31,20 @@ except ImportError:
         "CLIP dependencies not available. Install with: pip install torch transformers"
     )
 
+# ONNX Runtime is optional (only needed for backend="onnx")
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# ONNX graph file names inside AlignmentConfig.onnx_model_dir
+ONNX_VISION_FILE = "clip_vision.onnx"
+ONNX_TEXT_FILE = "clip_text.onnx"
+
+# CLIP's text context length; texts are padded to it so compiled graphs see one shape
+CLIP_TEXT_MAX_LENGTH = 77
+
 
 class CLIPAlignmentScorer:
     """
@@ -49,6 +68,12 @@ class CLIPAlignmentScorer:
         """
         self.config = config
 
+        self._onnx_vision = None
+        self._onnx_text = None
+        self._compiled = False
+        # Content hash -> normalized image embedding (LRU order)
+        self._image_feature_cache: "OrderedDict[bytes, torch.Tensor]" = OrderedDict()
+
         if not CLIP_AVAILABLE:
             self._model = None
             self._processor = None
@@ -83,12 +108,195 @@ class CLIPAlignmentScorer:
             self._model.eval()
 
             logger.info("CLIP model loaded successfully")
+
+            if self.config.backend == "onnx":
+                self._init_onnx_sessions()
+            elif self.config.compile_model and device == "cuda":
+                self._compile_model()
         except Exception as e:
             logger.error(f"Failed to load CLIP model: {e}")
             self._model = None
             self._processor = None
             self._device = None
 
+    def _compile_model(self):
+        """
+        Compile the CLIP feature extractors with torch.compile.
+        
+        Graphs are compiled for static shapes: texts are padded to
+        CLIP_TEXT_MAX_LENGTH and image batches to one of _image_buckets()
+        (see _encode_images), and the warm-up runs at exactly those shapes
+        so the first real call does not pay the compilation cost. Falls
+        back to eager mode if compilation fails.
+        """
+        if not hasattr(torch, "compile"):
+            logger.debug("torch.compile not available, running CLIP in eager mode")
+            return
+
+        eager_image_features = self._model.get_image_features
+        eager_text_features = self._model.get_text_features
+
+        try:
+            self._model.get_image_features = torch.compile(eager_image_features, dynamic=False)
+            self._model.get_text_features = torch.compile(eager_text_features, dynamic=False)
+
+            # Warm up with a dummy text and a dummy image batch per bucket size
+            warmup_image = Image.new("RGB", (224, 224))
+            inputs = self._processor(
+                text=["a photo"],
+                images=[warmup_image],
+                return_tensors="pt",
+                padding="max_length",
+                max_length=CLIP_TEXT_MAX_LENGTH,
+                truncation=True,
+            )
+            inputs = {k: v.to(self._device) for k, v in inputs.items()}
+            with torch.no_grad():
+                for bucket in self._image_buckets():
+                    pixel_values = inputs["pixel_values"].expand(bucket, -1, -1, -1).contiguous()
+                    self._model.get_image_features(pixel_values=pixel_values)
+                self._model.get_text_features(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs.get("attention_mask")
+                )
+
+            self._compiled = True
+            logger.info("CLIP feature extractors compiled with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, running CLIP in eager mode: {e}")
+            self._compiled = False
+            self._model.get_image_features = eager_image_features
+            self._model.get_text_features = eager_text_features
+
+    def _onnx_dir(self) -> pathlib.Path:
+        """Resolve the ONNX model directory (relative paths are from project root)."""
+        onnx_dir = pathlib.Path(self.config.onnx_model_dir)
+        if not onnx_dir.is_absolute():
+            project_root = pathlib.Path(__file__).resolve().parents[2]
+            onnx_dir = project_root / onnx_dir
+        return onnx_dir
+
+    def export_onnx(self, output_dir: Optional[str] = None) -> pathlib.Path:
+        """
+        Export the CLIP vision and text branches to ONNX.
+        
+        Args:
+            output_dir: Target directory (defaults to config.onnx_model_dir)
+            
+        Returns:
+            Directory containing the exported graphs
+        """
+        if self._model is None:
+            raise RuntimeError("CLIP model not loaded, cannot export to ONNX")
+
+        onnx_dir = pathlib.Path(output_dir) if output_dir else self._onnx_dir()
+        onnx_dir.mkdir(parents=True, exist_ok=True)
+
+        model = self._model
+
+        class _VisionBranch(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.model = model
+
+            def forward(self, pixel_values):
+                return self.model.get_image_features(pixel_values=pixel_values)
+
+        class _TextBranch(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.model = model
+
+            def forward(self, input_ids, attention_mask):
+                return self.model.get_text_features(input_ids=input_ids, attention_mask=attention_mask)
+
+        dummy = self._processor(
+            text=["a photo"],
+            images=[Image.new("RGB", (224, 224))],
+            return_tensors="pt",
+            padding=True,
+        )
+        dummy = {k: v.to(self._device) for k, v in dummy.items()}
+
+        with torch.no_grad():
+            torch.onnx.export(
+                _VisionBranch().eval(),
+                (dummy["pixel_values"],),
+                str(onnx_dir / ONNX_VISION_FILE),
+                input_names=["pixel_values"],
+                output_names=["image_embeds"],
+                dynamic_axes={"pixel_values": {0: "batch"}, "image_embeds": {0: "batch"}},
+                opset_version=17,
+            )
+            torch.onnx.export(
+                _TextBranch().eval(),
+                (dummy["input_ids"], dummy["attention_mask"]),
+                str(onnx_dir / ONNX_TEXT_FILE),
+                input_names=["input_ids", "attention_mask"],
+                output_names=["text_embeds"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "text_embeds": {0: "batch"},
+                },
+                opset_version=17,
+            )
+
+        logger.info(f"Exported CLIP ONNX graphs to {onnx_dir}")
+        return onnx_dir
+
+    def _init_onnx_sessions(self):
+        """
+        Load ONNX Runtime sessions for the CLIP vision and text branches.
+        
+        Exports the graphs on first use. Falls back to the PyTorch backend
+        if ONNX Runtime is not installed or the sessions fail to load.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            logger.warning("onnxruntime not available, using PyTorch backend for CLIP. Install with: pip install onnxruntime-gpu")
+            return
+
+        try:
+            onnx_dir = self._onnx_dir()
+            if not (onnx_dir / ONNX_VISION_FILE).exists() or not (onnx_dir / ONNX_TEXT_FILE).exists():
+                self.export_onnx(str(onnx_dir))
+
+            # Prefer TensorRT (FP16), then CUDA, then CPU - whichever are installed
+            available = set(ort.get_available_providers())
+            providers = []
+            if "TensorrtExecutionProvider" in available:
+                providers.append(("TensorrtExecutionProvider", {"trt_fp16_enable": True}))
+            if "CUDAExecutionProvider" in available:
+                providers.append("CUDAExecutionProvider")
+            providers.append("CPUExecutionProvider")
+
+            self._onnx_vision = ort.InferenceSession(str(onnx_dir / ONNX_VISION_FILE), providers=providers)
+            self._onnx_text = ort.InferenceSession(str(onnx_dir / ONNX_TEXT_FILE), providers=providers)
+            logger.info(f"CLIP ONNX Runtime sessions loaded (providers: {self._onnx_vision.get_providers()})")
+        except Exception as e:
+            logger.warning(f"Failed to load CLIP ONNX sessions, using PyTorch backend: {e}")
+            self._onnx_vision = None
+            self._onnx_text = None
+
+    def _get_image_features(self, pixel_values):
+        """Compute CLIP image embeddings with the configured backend."""
+        if self._onnx_vision is not None:
+            outputs = self._onnx_vision.run(None, {"pixel_values": pixel_values.cpu().numpy()})
+            return torch.from_numpy(outputs[0]).to(self._device)
+        return self._model.get_image_features(pixel_values=pixel_values)
+
+    def _get_text_features(self, input_ids, attention_mask=None):
+        """Compute CLIP text embeddings with the configured backend."""
+        if self._onnx_text is not None:
+            if attention_mask is None:
+                attention_mask = torch.ones_like(input_ids)
+            outputs = self._onnx_text.run(None, {
+                "input_ids": input_ids.cpu().numpy(),
+                "attention_mask": attention_mask.cpu().numpy(),
+            })
+            return torch.from_numpy(outputs[0]).to(self._device)
+        return self._model.get_text_features(input_ids=input_ids, attention_mask=attention_mask)
+
     def is_available(self) -> bool:
         """Check if CLIP is available and loaded."""
         return (
@@ -97,6 +305,105 @@ class CLIPAlignmentScorer:
             and self._processor is not None
         )
 
+    def _resolve_image_path(self, image_path: str) -> pathlib.Path:
+        """Resolve an image path (relative paths are from project root)."""
+        path = pathlib.Path(image_path)
+        if not path.is_absolute():
+            project_root = pathlib.Path(__file__).resolve().parents[2]
+            path = project_root / path
+        return path
+
+    def _load_pixel_values(self, path):
+        """
+        Decode and preprocess one image (path or file object) into CLIP pixel values.
+        
+        Runs on decode worker threads, so it only touches PIL and the
+        (stateless) image processor.
+        """
+        with Image.open(path) as img:
+            # Convert to RGB if necessary
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            inputs = self._processor(images=[img], return_tensors="pt")
+        return inputs["pixel_values"]
+
+    def _encode_text(self, text: str):
+        """Compute the normalized CLIP embedding for a text."""
+        inputs = self._processor(
+            text=[text],
+            return_tensors="pt",
+            padding="max_length",
+            max_length=CLIP_TEXT_MAX_LENGTH,
+            truncation=True,
+        )
+        inputs = {k: v.to(self._device) for k, v in inputs.items()}
+        with torch.no_grad():
+            text_features = self._get_text_features(
+                inputs["input_ids"],
+                inputs.get("attention_mask")
+            )
+        # Normalize features (CLIP uses normalized embeddings)
+        return text_features / text_features.norm(dim=-1, keepdim=True)
+
+    def _image_buckets(self) -> Tuple[int, ...]:
+        """Image batch sizes the compiled vision graph is warmed up for."""
+        # Single images (score_text_image) run unpadded; anything larger pads
+        # to config.batch_size, so only two graphs are compiled
+        return tuple(sorted({1, self.config.batch_size}))
+
+    def _encode_images(self, pixel_values):
+        """Compute normalized CLIP embeddings for a batch of pixel values."""
+        pixel_values = pixel_values.to(self._device)
+        with torch.no_grad():
+            if self._compiled:
+                # Batches hold only new, deduplicated images, so their size varies;
+                # pad each chunk up to the nearest warmed-up bucket size
+                buckets = self._image_buckets()
+                batch_size = buckets[-1]
+                chunks = []
+                for start in range(0, pixel_values.shape[0], batch_size):
+                    chunk = pixel_values[start:start + batch_size]
+                    n = chunk.shape[0]
+                    bucket = next(b for b in buckets if b >= n)
+                    if n < bucket:
+                        chunk = torch.cat([chunk, chunk.new_zeros((bucket - n, *chunk.shape[1:]))])
+                    chunks.append(self._get_image_features(chunk)[:n])
+                image_features = torch.cat(chunks)
+            else:
+                image_features = self._get_image_features(pixel_values)
+        return image_features / image_features.norm(dim=-1, keepdim=True)
+
+    def _score_stats(self, cosine_sims: "np.ndarray") -> Tuple["np.ndarray", List[Dict]]:
+        """
+        Map cosine similarities to [0, 1] scores and per-image threshold stats.
+        
+        Args:
+            cosine_sims: Array of cosine similarities in [-1, 1]
+            
+        Returns:
+            Tuple of (scores: np.ndarray, stats: list of dicts, one per score)
+        """
+        # Normalize to [0, 1] range: (cosine_sim + 1) / 2, clamped
+        # This maps: -1 (dissimilar) -> 0, 0 (neutral) -> 0.5, 1 (similar) -> 1
+        # CLIP features are float32: widen first so scores match the scalar path
+        cosine_sims = np.asarray(cosine_sims, dtype=np.float64)
+        scores = np.clip((cosine_sims + 1.0) * 0.5, 0.0, 1.0)
+        score_list = scores.tolist()
+        passed = (scores >= self.config.min_clip_score).tolist()
+        min_clip_score = self.config.min_clip_score
+
+        stats = [
+            {
+                "score": score_r,
+                "min_clip_score": min_clip_score,
+                "passed": ok,
+                "reason": "passed" if ok else f"score_too_low: {score:.4f} < {min_clip_score:.4f}",
+            }
+            for score, score_r, ok in zip(score_list, [round(s, 4) for s in score_list], passed)
+        ]
+
+        return scores, stats
+
     def score_text_image(
         self, text: str, image_path: str
     ) -> Tuple[Optional[float], Dict]:
@@ -121,12 +428,7 @@ class CLIPAlignmentScorer:
             }
 
         try:
-            # Load and preprocess image
-            path = pathlib.Path(image_path)
-            if not path.is_absolute():
-                # Try relative to project root
-                project_root = pathlib.Path(__file__).resolve().parents[2]
-                path = project_root / path
+            path = self._resolve_image_path(image_path)
 
             if not path.exists():
                 logger.debug(f"Image file not found for CLIP scoring: {path}")
@@ -136,61 +438,15 @@ class CLIPAlignmentScorer:
                     "passed": True,  # Graceful fallback
                 }
 
-            # Open image
-            with Image.open(path) as img:
-                # Convert to RGB if necessary
-                if img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-
-                # Process inputs
-                inputs = self._processor(
-                    text=[text],
-                    images=[img],
-                    return_tensors="pt",
-                    padding=True,
-                    truncation=True,
-                )
+            image_features = self._encode_images(self._load_pixel_values(path))
+            text_features = self._encode_text(text)
 
-                # Move inputs to device
-                inputs = {k: v.to(self._device) for k, v in inputs.items()}
-
-                # Compute similarity using CLIP
-                with torch.no_grad():
-                    # Get image and text features
-                    image_features = self._model.get_image_features(
-                        pixel_values=inputs["pixel_values"]
-                    )
-                    text_features = self._model.get_text_features(
-                        input_ids=inputs["input_ids"],
-                        attention_mask=inputs.get("attention_mask")
-                    )
-
-                    # Normalize features (CLIP uses normalized embeddings)
-                    image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-                    text_features = text_features / text_features.norm(dim=-1, keepdim=True)
-
-                    # Compute cosine similarity (dot product of normalized vectors)
-                    # This gives us a score in [-1, 1] range
-                    cosine_sim = (image_features @ text_features.T).squeeze().item()
-
-                    # Normalize to [0, 1] range: (cosine_sim + 1) / 2
-                    # This maps: -1 (dissimilar) -> 0, 0 (neutral) -> 0.5, 1 (similar) -> 1
-                    score = (cosine_sim + 1.0) / 2.0
-
-                    # Ensure score is in [0, 1] and clamp if needed
-                    score = max(0.0, min(1.0, score))
-
-                # Check if score meets threshold
-                passed = score >= self.config.min_clip_score
-
-                stats = {
-                    "score": round(score, 4),
-                    "min_clip_score": self.config.min_clip_score,
-                    "passed": passed,
-                    "reason": "passed" if passed else f"score_too_low: {score:.4f} < {self.config.min_clip_score:.4f}",
-                }
+            # Compute cosine similarity (dot product of normalized vectors)
+            # This gives us a score in [-1, 1] range
+            cosine_sims = (image_features @ text_features.T).squeeze(-1).cpu().numpy()
 
-                return score, stats
+            scores, stats = self._score_stats(cosine_sims)
+            return float(scores[0]), stats[0]
 
         except Exception as e:
             logger.debug(f"Error computing CLIP score for {image_path}: {e}")
@@ -206,6 +462,10 @@ class CLIPAlignmentScorer:
         """
         Score multiple images against text and filter by alignment score.
         
+        The text is encoded once. Images are scored in batches of
+        config.batch_size, and the next batch is decoded on worker threads
+        while the current one runs through CLIP (double buffering).
+        
         Args:
             text: Text content to compare against
             images: List of image dictionaries with 'path' key
@@ -220,21 +480,37 @@ class CLIPAlignmentScorer:
             logger.debug("CLIP not available, skipping alignment filtering")
             return images, []
 
-        aligned_images = []
-        misaligned_images = []
+        # Per-image stats in input order (None = unscored, kept leniently)
+        results: List[Optional[Dict]] = [None] * len(images)
 
-        for image in images:
+        # Images with an existing file are scored; the rest are kept (lenient)
+        scorable = []
+        for idx, image in enumerate(images):
             image_path = image.get("path")
-
             if not image_path:
-                # No path available, can't score - keep it (lenient)
-                aligned_images.append(image)
                 continue
+            path = self._resolve_image_path(image_path)
+            if not path.exists():
+                logger.debug(f"Image file not found for CLIP scoring: {path}")
+                continue
+            scorable.append((idx, path))
 
-            score, stats = self.score_text_image(text, image_path)
+        if scorable:
+            try:
+                text_features = self._encode_text(text)
+            except Exception as e:
+                logger.debug(f"Error encoding text for CLIP scoring: {e}")
+                text_features = None
 
-            if score is None:
-                # Scoring failed - keep image (lenient)
+            if text_features is not None:
+                self._score_batches(text_features, scorable, results)
+
+        aligned_images = []
+        misaligned_images = []
+
+        for image, stats in zip(images, results):
+            if stats is None:
+                # No path, missing file or scoring failed - keep image (lenient)
                 aligned_images.append(image)
                 continue
 
@@ -251,6 +527,106 @@ class CLIPAlignmentScorer:
 
         return aligned_images, misaligned_images
 
+    def _read_image(self, path: pathlib.Path) -> Tuple[bytes, Optional["torch.Tensor"]]:
+        """
+        Read an image file and decode it unless its features are cached.
+        
+        Returns:
+            Tuple of (content hash, pixel values or None if already cached)
+        """
+        data = path.read_bytes()
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        if key in self._image_feature_cache:
+            return key, None
+        return key, self._load_pixel_values(io.BytesIO(data))
+
+    def _batch_image_features(self, loaded: List[Tuple[int, bytes, Optional["torch.Tensor"]]]):
+        """
+        Get normalized image embeddings for a batch, encoding each new image once.
+        
+        Args:
+            loaded: (index, content hash, pixel values or None) per image
+            
+        Returns:
+            Embeddings [B, D] in the order of `loaded`
+        """
+        cache = self._image_feature_cache
+
+        # Distinct images not seen before (shared images appear once)
+        new_pixels: Dict[bytes, "torch.Tensor"] = {}
+        for _, key, pixel_values in loaded:
+            if pixel_values is not None and key not in cache and key not in new_pixels:
+                new_pixels[key] = pixel_values
+
+        new_features = {}
+        if new_pixels:
+            features = self._encode_images(torch.cat(list(new_pixels.values()), dim=0))
+            new_features = dict(zip(new_pixels.keys(), features))
+            if self.config.image_feature_cache_size > 0:
+                cache.update(new_features)
+
+        rows = []
+        for _, key, _ in loaded:
+            if key in new_features:
+                rows.append(new_features[key])
+            else:
+                cache.move_to_end(key)
+                rows.append(cache[key])
+        return torch.stack(rows)
+
+    def _score_batches(self, text_features, scorable: List[Tuple[int, pathlib.Path]], results: List[Optional[Dict]]):
+        """
+        Score (index, path) pairs in batches, prefetching the next batch.
+        
+        Images are keyed by content hash: an image already encoded (on
+        this page or an earlier one) reuses its cached embedding.
+        
+        Args:
+            text_features: Normalized text embedding [1, D]
+            scorable: (index into results, resolved image path) pairs
+            results: Output list; stats are stored at each scored index
+        """
+        batch_size = self.config.batch_size
+        batches = [scorable[i:i + batch_size] for i in range(0, len(scorable), batch_size)]
+
+        with ThreadPoolExecutor(max_workers=self.config.num_decode_workers) as pool:
+            def submit(batch):
+                return [(idx, pool.submit(self._read_image, path)) for idx, path in batch]
+
+            pending = submit(batches[0])
+            for batch_num in range(len(batches)):
+                current = pending
+                # Start decoding the next batch before running inference on this one
+                if batch_num + 1 < len(batches):
+                    pending = submit(batches[batch_num + 1])
+
+                loaded = []
+                for idx, future in current:
+                    try:
+                        key, pixel_values = future.result()
+                        loaded.append((idx, key, pixel_values))
+                    except Exception as e:
+                        logger.debug(f"Error loading image for CLIP scoring: {e}")
+
+                if not loaded:
+                    continue
+
+                try:
+                    image_features = self._batch_image_features(loaded)
+                    cosine_sims = (image_features @ text_features.T).squeeze(-1).cpu().numpy()
+                except Exception as e:
+                    logger.debug(f"Error computing CLIP scores for batch: {e}")
+                    continue
+
+                _, batch_stats = self._score_stats(cosine_sims)
+                for (idx, _, _), stats in zip(loaded, batch_stats):
+                    results[idx] = stats
+
+        # Evict least recently used embeddings only after all batches are
+        # scored, so prefetched cache hits stay valid
+        while len(self._image_feature_cache) > self.config.image_feature_cache_size:
+            self._image_feature_cache.popitem(last=False)
+
     def filter_by_alignment(
         self, text: str, images: List[Dict]
     ) -> Tuple[List[Dict], List[Dict]]:
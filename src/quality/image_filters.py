@@ -5,23 +5,149 @@ This module provides image quality filters to ensure downloaded images
 meet minimum quality standards before being included in the corpus.
 """
 
+import functools
+import importlib.util
 import logging
+import os
 import pathlib
-from typing import Dict, List, Optional, Tuple, Set
-
-from PIL import Image
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Set
+
+import numpy as np
 from src.config import ImageQualityConfig
 
 logger = logging.getLogger(__name__)
 
-# Try to import imagehash, handle gracefully if not available
-try:
-    import imagehash
-    IMAGEHASH_AVAILABLE = True
-except ImportError:
-    IMAGEHASH_AVAILABLE = False
+# PIL, imagehash and numba are only needed for duplicate detection, so they
+# are imported on first use; check_resolution/aspect_ratio/format need none
+IMAGEHASH_AVAILABLE = importlib.util.find_spec("imagehash") is not None
+if not IMAGEHASH_AVAILABLE:
     logger.warning("imagehash not available, duplicate detection will be skipped. Install with: pip install imagehash")
 
+# Optional numba JIT for the duplicate scan (falls back to NumPy)
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+@functools.cache
+def _imagehash():
+    """Import imagehash on first use."""
+    import imagehash
+    return imagehash
+
+
+@functools.cache
+def _pil_image():
+    """Import PIL.Image on first use."""
+    from PIL import Image
+    return Image
+
+
+# Relative image paths are resolved against the project root
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+# Equivalent file extensions, normalized before the allow-list check
+_FORMAT_ALIASES = {"jpg": "jpeg", "jpe": "jpeg", "tif": "tiff"}
+
+# File extension at the end of a URL path, before any query string
+_URL_EXT_RE = re.compile(r'\.([A-Za-z0-9]{1,5})(?:\?|$)')
+
+# Denominator of the rational aspect-ratio threshold (3 decimal places)
+ASPECT_RATIO_SCALE = 1000
+
+# Initial size of the seen-hash arrays in duplicate detection (doubled on overflow)
+SEEN_HASHES_INITIAL_CAPACITY = 1024
+
+# Images hashed together (in parallel) while streaming through duplicate detection
+DEDUP_CHUNK_SIZE = 256
+
+# Smallest edge requested from the JPEG decoder before hashing; every
+# supported hash works on <= 32x32 pixels, so decoding more is wasted
+HASH_DECODE_SIZE = 64
+
+# Part of every on-disk hash cache key; bump whenever decoding or hashing
+# changes (e.g. the reduced JPEG draft decode) so stale hashes are not reused
+HASH_CACHE_VERSION = 2
+
+
+def _resolve_image_path(image_path: str) -> str:
+    """Resolve a (possibly project-relative) image path to an absolute path."""
+    if os.path.isabs(image_path):
+        return image_path
+    return os.path.join(_PROJECT_ROOT, image_path)
+
+
+def _hash_to_uint64(hash_obj) -> np.uint64:
+    """Pack a 64-bit ImageHash (8x8 bool array) into one uint64."""
+    return np.packbits(hash_obj.hash.flatten()).view(np.uint64)[0]
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Count set bits per uint64 element."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    # NumPy < 2.0: unpack each 8-byte word and sum its bits
+    bits = np.unpackbits(values.view(np.uint8)).reshape(-1, 64)
+    return bits.sum(axis=1)
+
+
+def _first_match_numpy(seen_hashes: np.ndarray, n_seen: int, packed: np.uint64, threshold: int) -> Tuple[int, int]:
+    """
+    Find the earliest seen hash within `threshold` bits of `packed`.
+
+    Returns:
+        Tuple of (position in seen_hashes or -1, Hamming distance)
+    """
+    # Hamming distance to every seen hash in one XOR + popcount
+    distances = _popcount(seen_hashes[:n_seen] ^ packed)
+    matches = np.flatnonzero(distances <= threshold)
+    if matches.size:
+        first = matches[0]
+        return int(first), int(distances[first])
+    return -1, 0
+
+
+@functools.cache
+def _first_match_kernel():
+    """Compile the numba duplicate-scan kernel on first use (None without numba)."""
+    if not NUMBA_AVAILABLE:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True, nogil=True)
+    def first_match(seen_hashes, n_seen, packed, threshold):
+        # Fused XOR + SWAR popcount + threshold test, stopping at the first match
+        m1 = np.uint64(0x5555555555555555)
+        m2 = np.uint64(0x3333333333333333)
+        m4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+        h01 = np.uint64(0x0101010101010101)
+        for j in range(n_seen):
+            x = seen_hashes[j] ^ packed
+            x = x - ((x >> np.uint64(1)) & m1)
+            x = (x & m2) + ((x >> np.uint64(2)) & m2)
+            x = (x + (x >> np.uint64(4))) & m4
+            d = np.int64((x * h01) >> np.uint64(56))
+            if d <= threshold:
+                return j, d
+        return -1, 0
+
+    return first_match
+
+
+def _first_match(seen_hashes: np.ndarray, n_seen: int, packed: np.uint64, threshold: int) -> Tuple[int, int]:
+    """Same as _first_match_numpy, JIT-compiled with numba when available."""
+    kernel = _first_match_kernel()
+    if kernel is None:
+        return _first_match_numpy(seen_hashes, n_seen, packed, threshold)
+    position, distance = kernel(seen_hashes, n_seen, np.uint64(packed), threshold)
+    return int(position), int(distance)
+
 
 class ImageQualityFilter:
     """
@@ -42,27 +168,79 @@ class ImageQualityFilter:
             config: ImageQualityConfig instance with filter parameters
         """
         self.config = config
-        self._init_hash_algorithm()
-
-    def _init_hash_algorithm(self):
-        """Initialize the hash algorithm function based on config."""
+        # Normalized allow-list, so the per-image check is one set lookup
+        self._allowed_formats = frozenset(
+            _FORMAT_ALIASES.get(fmt.lower(), fmt.lower()) for fmt in config.allowed_formats
+        )
+        # Thresholds read on every image, unpacked once
+        self._min_w, self._min_h = config.min_resolution
+        self._max_ar = config.max_aspect_ratio
+        # Aspect ratio threshold as a rational, compared by integer cross-multiplication
+        self._ar_num = round(config.max_aspect_ratio * ASPECT_RATIO_SCALE)
+        self._ar_den = ASPECT_RATIO_SCALE
+        self._hash_cache = None
+        self._hash_cache_lock = threading.Lock()
+        if config.hash_cache_path and config.enable_duplicate_detection and IMAGEHASH_AVAILABLE:
+            self._open_hash_cache(config.hash_cache_path)
+
+    def _open_hash_cache(self, cache_path: str):
+        """Open (or create) the on-disk hash cache, disabling it on failure."""
+        try:
+            cache_file = pathlib.Path(cache_path)
+            if not cache_file.is_absolute():
+                cache_file = _PROJECT_ROOT / cache_file
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._hash_cache = sqlite3.connect(str(cache_file), check_same_thread=False)
+            self._hash_cache.execute(
+                "CREATE TABLE IF NOT EXISTS image_hashes (key TEXT PRIMARY KEY, hash TEXT NOT NULL)"
+            )
+            self._hash_cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open image hash cache {cache_path}: {e}")
+            self._hash_cache = None
+
+    def close(self):
+        """Close the on-disk hash cache, if open."""
+        with self._hash_cache_lock:
+            if self._hash_cache is not None:
+                self._hash_cache.close()
+                self._hash_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # Attributes may be missing if __init__ failed part-way
+        if getattr(self, "_hash_cache", None) is not None:
+            self.close()
+
+    @functools.cached_property
+    def _hash_func(self):
+        """Hash algorithm function based on config (imports imagehash on first access)."""
         if not IMAGEHASH_AVAILABLE:
-            self._hash_func = None
-            return
+            return None
+        try:
+            imagehash = _imagehash()
+        except ImportError as e:
+            logger.warning(f"imagehash failed to import, duplicate detection will be skipped: {e}")
+            return None
 
         algorithm = self.config.duplicate_hash_algorithm
 
         if algorithm == "phash":
-            self._hash_func = imagehash.phash
+            return imagehash.phash
         elif algorithm == "dhash":
-            self._hash_func = imagehash.dhash
+            return imagehash.dhash
         elif algorithm == "whash":
-            self._hash_func = imagehash.whash
+            return imagehash.whash
         elif algorithm == "average_hash":
-            self._hash_func = imagehash.average_hash
+            return imagehash.average_hash
         else:
-            logger.warning(f"Unknown hash algorithm: {algorithm}, using phash")
-            self._hash_func = imagehash.phash
+            logger.warning(f"Unknown hash algorithm: {algorithm}, using dhash")
+            return imagehash.dhash
 
     def check_resolution(self, width: Optional[int], height: Optional[int]) -> Tuple[bool, Dict]:
         """
@@ -75,7 +253,7 @@ class ImageQualityFilter:
         Returns:
             Tuple of (passed: bool, stats: dict)
         """
-        min_width, min_height = self.config.min_resolution
+        min_width, min_height = self._min_w, self._min_h
 
         # If dimensions are unknown, we can't validate - be lenient and pass
         if width is None or height is None:
@@ -118,26 +296,58 @@ class ImageQualityFilter:
             return True, {
                 "aspect_ratio_passed": True,
                 "aspect_ratio": None,
-                "max_aspect_ratio": self.config.max_aspect_ratio,
+                "max_aspect_ratio": self._max_ar,
                 "reason": "dimensions_unknown"
             }
 
-        # Calculate aspect ratio (width/height)
         # Handle both landscape and portrait orientations
-        aspect_ratio = max(width, height) / min(width, height)
-
-        passed = aspect_ratio <= self.config.max_aspect_ratio
+        longer, shorter = (width, height) if width >= height else (height, width)
+        passed = longer * self._ar_den <= self._ar_num * shorter
 
         stats = {
             "aspect_ratio_passed": passed,
-            "aspect_ratio": round(aspect_ratio, 2),
-            "max_aspect_ratio": self.config.max_aspect_ratio,
+            "aspect_ratio": round(longer / shorter, 2) if shorter else float("inf"),
+            "max_aspect_ratio": self._max_ar,
             "width": width,
             "height": height,
         }
 
         return passed, stats
 
+    def _extract_format(self, image_path: Optional[str], image_url: Optional[str]) -> Optional[str]:
+        """Determine the lowercased file extension from path or URL (None if unknown)."""
+        if image_path:
+            # Extract extension from path (only the extension is lowercased)
+            return os.path.splitext(image_path)[1][1:].lower() or None
+        if image_url:
+            # Extension right before the query string or end of URL
+            # Only accept if it looks like a file extension (short, alphanumeric)
+            match = _URL_EXT_RE.search(image_url)
+            if match:
+                return match.group(1).lower()
+        return None
+
+    def _resolution_ok(self, width: Optional[int], height: Optional[int]) -> bool:
+        """Resolution check without stats (unknown dimensions pass)."""
+        if width is None or height is None:
+            return True
+        return width >= self._min_w and height >= self._min_h
+
+    def _aspect_ratio_ok(self, width: Optional[int], height: Optional[int]) -> bool:
+        """Aspect ratio check without stats (unknown dimensions pass)."""
+        if width is None or height is None or height == 0:
+            return True
+        if width >= height:
+            return width * self._ar_den <= self._ar_num * height
+        return height * self._ar_den <= self._ar_num * width
+
+    def _format_ok(self, image_path: Optional[str], image_url: Optional[str] = None) -> bool:
+        """Format check without stats (unknown format passes)."""
+        format_str = self._extract_format(image_path, image_url)
+        if format_str is None:
+            return True
+        return _FORMAT_ALIASES.get(format_str, format_str) in self._allowed_formats
+
     def check_format(self, image_path: Optional[str], image_url: Optional[str] = None) -> Tuple[bool, Dict]:
         """
         Check if image format is in allowed list.
@@ -149,26 +359,7 @@ class ImageQualityFilter:
         Returns:
             Tuple of (passed: bool, stats: dict)
         """
-        # Determine format from path or URL
-        format_str = None
-
-        if image_path:
-            # Extract extension from path
-            # Handle both "path/to/file.jpg" and "file.jpg" formats
-            parts = image_path.lower().rsplit('.', 1)  # Split from right, max 1 split
-            if len(parts) == 2:
-                format_str = parts[1]
-        elif image_url:
-            # Extract extension from URL
-            # Remove query params first
-            url_without_params = image_url.lower().split('?')[0]
-            # Split from right to get extension
-            parts = url_without_params.rsplit('.', 1)
-            if len(parts) == 2:
-                potential_format = parts[1]
-                # Only accept if it looks like a file extension (short, alphanumeric)
-                if len(potential_format) <= 5 and potential_format.isalnum():
-                    format_str = potential_format
+        format_str = self._extract_format(image_path, image_url)
 
         if format_str is None:
             # Format unknown - be lenient and pass
@@ -180,11 +371,9 @@ class ImageQualityFilter:
             }
 
         # Normalize format (jpg/jpeg are the same)
-        normalized_format = format_str
-        if format_str == "jpg":
-            normalized_format = "jpeg"
+        normalized_format = _FORMAT_ALIASES.get(format_str, format_str)
 
-        passed = normalized_format in self.config.allowed_formats
+        passed = normalized_format in self._allowed_formats
 
         stats = {
             "format_passed": passed,
@@ -194,7 +383,7 @@ class ImageQualityFilter:
 
         return passed, stats
 
-    def filter_image(self, image_data: Dict) -> Dict:
+    def filter_image(self, image_data: Dict, collect_stats: bool = True) -> Dict:
         """
         Apply all image quality filters to a single image.
         
@@ -205,6 +394,8 @@ class ImageQualityFilter:
                 - path: str or None (file path)
                 - url: str or None (original URL)
                 - format: str or None (optional, will be inferred)
+            collect_stats: If False, a passing image gets stats=None and no
+                stats dicts are built (failures always include full stats)
                 
         Returns:
             Dictionary with keys:
@@ -217,6 +408,13 @@ class ImageQualityFilter:
         path = image_data.get("path")
         url = image_data.get("url")
 
+        if not collect_stats and (
+            self._resolution_ok(width, height)
+            and self._aspect_ratio_ok(width, height)
+            and self._format_ok(path, url)
+        ):
+            return {"passed": True, "reason": "passed", "stats": None}
+
         all_stats = {}
 
         # Check resolution
@@ -225,7 +423,7 @@ class ImageQualityFilter:
         if not resolution_passed:
             return {
                 "passed": False,
-                "reason": f"resolution_too_small: {width}x{height} (min: {self.config.min_resolution[0]}x{self.config.min_resolution[1]})",
+                "reason": f"resolution_too_small: {width}x{height} (min: {self._min_w}x{self._min_h})",
                 "stats": all_stats
             }
 
@@ -236,7 +434,7 @@ class ImageQualityFilter:
             aspect_ratio = aspect_stats.get("aspect_ratio", 0.0)
             return {
                 "passed": False,
-                "reason": f"aspect_ratio_too_extreme: {aspect_ratio:.2f} (max: {self.config.max_aspect_ratio:.2f})",
+                "reason": f"aspect_ratio_too_extreme: {aspect_ratio:.2f} (max: {self._max_ar:.2f})",
                 "stats": all_stats
             }
 
@@ -258,33 +456,34 @@ class ImageQualityFilter:
             "stats": all_stats
         }
 
-    def filter_images(self, images: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    def _check_dimensions_batch(self, images: List[Dict]) -> np.ndarray:
         """
-        Filter a list of images, returning passed and failed images.
+        Vectorized resolution and aspect ratio check for a batch of images.
+        
+        Same rules as check_resolution/check_aspect_ratio: images with
+        unknown dimensions pass.
         
         Args:
             images: List of image metadata dictionaries
             
         Returns:
-            Tuple of (passed_images: List[Dict], failed_images: List[Dict])
-            Each failed image includes a 'filter_reason' field explaining why it failed
+            Boolean array, True where both checks pass
         """
-        passed_images = []
-        failed_images = []
+        min_width, min_height = self._min_w, self._min_h
 
-        for image in images:
-            filter_result = self.filter_image(image)
+        widths = [image.get("width") for image in images]
+        heights = [image.get("height") for image in images]
+        known = np.array([w is not None and h is not None for w, h in zip(widths, heights)], dtype=bool)
+        w = np.array([w if k else 0 for w, k in zip(widths, known)], dtype=np.int64)
+        h = np.array([h if k else 0 for h, k in zip(heights, known)], dtype=np.int64)
 
-            if filter_result["passed"]:
-                passed_images.append(image)
-            else:
-                # Add filter reason to failed image
-                failed_image = image.copy()
-                failed_image["filter_reason"] = filter_result["reason"]
-                failed_image["filter_stats"] = filter_result["stats"]
-                failed_images.append(failed_image)
+        resolution_ok = ~known | ((w >= min_width) & (h >= min_height))
 
-        return passed_images, failed_images
+        longer = np.maximum(w, h)
+        shorter = np.minimum(w, h)
+        aspect_ok = ~known | (h == 0) | (longer * self._ar_den <= self._ar_num * shorter)
+
+        return resolution_ok & aspect_ok
 
     def _compute_image_hash(self, image_path: str) -> Optional[str]:
         """
@@ -296,134 +495,273 @@ class ImageQualityFilter:
         Returns:
             Hash string (hex) or None if computation fails
         """
+        hash_value = self._compute_image_hash_obj(image_path)
+        return str(hash_value) if hash_value is not None else None
+
+    def _compute_image_hash_obj(self, image_path: str) -> Optional["imagehash.ImageHash"]:
+        """
+        Compute perceptual hash for an image file as an ImageHash object.
+        
+        Args:
+            image_path: Path to image file (can be relative or absolute)
+            
+        Returns:
+            ImageHash (supports Hamming distance via subtraction) or None if computation fails
+        """
         if not IMAGEHASH_AVAILABLE or self._hash_func is None:
             return None
 
         try:
             # Handle relative paths (relative to project root)
-            path = pathlib.Path(image_path)
-            if not path.is_absolute():
+            if os.path.isabs(image_path):
+                path = image_path
+            else:
                 # Try relative to project root
-                project_root = pathlib.Path(__file__).resolve().parents[2]
-                path = project_root / path
+                path = os.path.join(_PROJECT_ROOT, image_path)
 
-            if not path.exists():
+            if not os.path.exists(path):
                 logger.debug(f"Image file not found for hash computation: {path}")
                 return None
 
             # Open and compute hash
-            with Image.open(path) as img:
-                # Convert to RGB if necessary (handles RGBA, P, etc.)
-                if img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
+            with _pil_image().open(path) as img:
+                # JPEG: let libjpeg scale down during decode (1/2, 1/4, 1/8 IDCT)
+                # and emit luma only, skipping the chroma channels entirely
+                if img.format == "JPEG":
+                    img.draft("L", (HASH_DECODE_SIZE, HASH_DECODE_SIZE))
+
+                # All supported hashes work on grayscale (handles RGB, RGBA, P, etc.)
+                if img.mode != 'L':
+                    img = img.convert('L')
 
-                hash_value = self._hash_func(img)
-                return str(hash_value)
+                return self._hash_func(img)
 
         except Exception as e:
             logger.debug(f"Error computing hash for {image_path}: {e}")
             return None
 
-    def _detect_duplicates(self, images: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    def _compute_hashes(self, images: List[Dict]) -> List[Optional["imagehash.ImageHash"]]:
+        """
+        Compute perceptual hashes for a list of images in parallel.
+        
+        Image decode and hashing run in C code that releases the GIL, so
+        a thread pool scales with the number of cores.
+        
+        Args:
+            images: List of image dictionaries with 'path' keys
+            
+        Returns:
+            Hash per image (None if the image has no path or hashing failed)
+        """
+        paths = [image.get("path") for image in images]
+        to_hash = [path for path in paths if path]
+
+        cache_keys: List[Optional[str]] = []
+        cached: Dict[str, "imagehash.ImageHash"] = {}
+        if self._hash_cache is not None:
+            cache_keys = [self._hash_cache_key(path) for path in to_hash]
+            cached = self._hash_cache_get([key for key in cache_keys if key])
+            misses = [
+                path for path, key in zip(to_hash, cache_keys) if key not in cached
+            ]
+        else:
+            misses = to_hash
+
+        workers = min(self.config.hash_workers or os.cpu_count() or 1, len(misses))
+        if workers <= 1:
+            computed = [self._compute_image_hash_obj(path) for path in misses]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                computed = list(pool.map(self._compute_image_hash_obj, misses))
+
+        if self._hash_cache is not None:
+            computed_iter = iter(computed)
+            new_entries = {}
+            hashes = []
+            for key in cache_keys:
+                if key in cached:
+                    hashes.append(cached[key])
+                    continue
+                hash_value = next(computed_iter)
+                if key and hash_value is not None:
+                    new_entries[key] = hash_value
+                hashes.append(hash_value)
+            self._hash_cache_put(new_entries)
+            computed = hashes
+
+        computed_iter = iter(computed)
+        return [next(computed_iter) if path else None for path in paths]
+
+    def _hash_cache_key(self, image_path: str) -> Optional[str]:
+        """Cache key for an image file: absolute path, mtime, size, algorithm and cache version."""
+        path = _resolve_image_path(image_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (
+            f"{path}:{st.st_mtime_ns}:{st.st_size}:"
+            f"{self.config.duplicate_hash_algorithm}:v{HASH_CACHE_VERSION}"
+        )
+
+    def _hash_cache_get(self, keys: List[str]) -> Dict[str, "imagehash.ImageHash"]:
+        """Look up cached hashes (chunked to stay under SQLite's parameter limit)."""
+        found = {}
+        chunk = 500
+        with self._hash_cache_lock:
+            try:
+                for start in range(0, len(keys), chunk):
+                    batch = keys[start:start + chunk]
+                    rows = self._hash_cache.execute(
+                        "SELECT key, hash FROM image_hashes WHERE key IN "
+                        f"({','.join('?' * len(batch))})",
+                        batch,
+                    )
+                    for key, hex_hash in rows:
+                        found[key] = _imagehash().hex_to_hash(hex_hash)
+            except (sqlite3.Error, ValueError) as e:
+                logger.debug(f"Image hash cache lookup failed: {e}")
+        return found
+
+    def _hash_cache_put(self, entries: Dict[str, "imagehash.ImageHash"]):
+        """Store newly computed hashes and commit once per batch."""
+        if not entries:
+            return
+        with self._hash_cache_lock:
+            try:
+                self._hash_cache.executemany(
+                    "INSERT OR REPLACE INTO image_hashes (key, hash) VALUES (?, ?)",
+                    [(key, str(value)) for key, value in entries.items()],
+                )
+                self._hash_cache.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Image hash cache write failed: {e}")
+
+    def _detect_duplicates(self, images: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """
         Detect duplicate and near-duplicate images using perceptual hashing.
         
+        Images are consumed in chunks, so a generator can be streamed in
+        without materializing the whole input first.
+        
         Args:
-            images: List of image dictionaries with 'path' or 'url' keys
+            images: Iterable of image dictionaries with 'path' or 'url' keys
             
         Returns:
             Tuple of (unique_images: List[Dict], duplicate_images: List[Dict])
             Duplicate images include 'duplicate_of' field pointing to the first occurrence
         """
         if not self.config.enable_duplicate_detection:
-            return images, []
+            return list(images), []
 
         if not IMAGEHASH_AVAILABLE or self._hash_func is None:
             logger.debug("Duplicate detection skipped: imagehash not available")
-            return images, []
+            return list(images), []
 
-        if len(images) < self.config.min_images_for_duplicate_check:
-            return images, []
+        images = iter(images)
+        head = list(islice(images, self.config.min_images_for_duplicate_check))
+        if len(head) < self.config.min_images_for_duplicate_check:
+            return head, []
+        images = chain(head, images)
 
         unique_images = []
         duplicate_images = []
-        seen_hashes: Dict[str, int] = {}  # hash -> index of first occurrence
-
-        for idx, image in enumerate(images):
-            image_path = image.get("path")
-
-            if not image_path:
-                # No path available, can't compute hash - keep it
-                unique_images.append(image)
-                continue
-
-            # Compute hash
-            image_hash = self._compute_image_hash(image_path)
-
-            if image_hash is None:
-                # Hash computation failed - keep image (lenient)
-                unique_images.append(image)
-                continue
+        # Packed 64-bit hashes of unique images and their index in unique_images,
+        # kept as parallel arrays (grown by doubling) for a contiguous scan
+        capacity = SEEN_HASHES_INITIAL_CAPACITY
+        seen_hashes = np.empty(capacity, dtype=np.uint64)
+        seen_indices = np.empty(capacity, dtype=np.int32)
+        n_seen = 0
+        threshold = self.config.duplicate_similarity_threshold
+        # threshold=0 only matches identical hashes: a dict lookup, no Hamming scan
+        exact_only = threshold == 0
+        exact_seen: Dict[int, int] = {}
+
+        # Hash each chunk in parallel, then merge sequentially
+        while True:
+            chunk = list(islice(images, DEDUP_CHUNK_SIZE))
+            if not chunk:
+                break
+            hashes = self._compute_hashes(chunk)
+
+            for image, hash_obj in zip(chunk, hashes):
+                if hash_obj is None:
+                    # No path or hash computation failed - keep image (lenient)
+                    unique_images.append(image)
+                    continue
 
-            # Check for duplicates
-            is_duplicate = False
-            duplicate_of_idx = None
-            hamming_distance = None
+                # Check for duplicates
+                is_duplicate = False
+                duplicate_of_idx = None
+                hamming_distance = None
 
-            for seen_hash, first_idx in seen_hashes.items():
-                # Calculate Hamming distance
                 try:
-                    hash1 = imagehash.hex_to_hash(image_hash)
-                    hash2 = imagehash.hex_to_hash(seen_hash)
-                    hamming_distance = hash1 - hash2
-
-                    if hamming_distance <= self.config.duplicate_similarity_threshold:
-                        # This is a duplicate
-                        is_duplicate = True
-                        duplicate_of_idx = first_idx
-                        break
+                    packed = _hash_to_uint64(hash_obj)
                 except Exception as e:
                     logger.debug(f"Error comparing hashes: {e}")
+                    unique_images.append(image)
                     continue
 
-            if is_duplicate and duplicate_of_idx is not None:
-                # Mark as duplicate
-                duplicate_image = image.copy()
-                duplicate_image["duplicate_of"] = unique_images[duplicate_of_idx].get(
-                    "url") or unique_images[duplicate_of_idx].get("path")
-                duplicate_image["hamming_distance"] = hamming_distance
-                duplicate_image[
-                    "filter_reason"] = f"duplicate_image: hamming_distance={hamming_distance} (threshold={self.config.duplicate_similarity_threshold})"
-                duplicate_images.append(duplicate_image)
-            else:
-                # New unique image
-                seen_hashes[image_hash] = len(unique_images)
-                unique_images.append(image)
+                if exact_only:
+                    duplicate_of_idx = exact_seen.get(int(packed))
+                    if duplicate_of_idx is not None:
+                        hamming_distance = 0
+                        is_duplicate = True
+                elif n_seen:
+                    # Earliest unique image within threshold is the original
+                    first, distance = _first_match(seen_hashes, n_seen, packed, threshold)
+                    if first >= 0:
+                        duplicate_of_idx = int(seen_indices[first])
+                        hamming_distance = distance
+                        is_duplicate = True
+
+                if is_duplicate and duplicate_of_idx is not None:
+                    # Mark as duplicate
+                    duplicate_image = image.copy()
+                    duplicate_image["duplicate_of"] = unique_images[duplicate_of_idx].get(
+                        "url") or unique_images[duplicate_of_idx].get("path")
+                    duplicate_image["hamming_distance"] = hamming_distance
+                    duplicate_image[
+                        "filter_reason"] = f"duplicate_image: hamming_distance={hamming_distance} (threshold={self.config.duplicate_similarity_threshold})"
+                    duplicate_images.append(duplicate_image)
+                else:
+                    # New unique image
+                    if exact_only:
+                        exact_seen[int(packed)] = len(unique_images)
+                        unique_images.append(image)
+                        continue
+                    if n_seen == capacity:
+                        capacity *= 2
+                        seen_hashes = np.resize(seen_hashes, capacity)
+                        seen_indices = np.resize(seen_indices, capacity)
+                    seen_hashes[n_seen] = packed
+                    seen_indices[n_seen] = len(unique_images)
+                    n_seen += 1
+                    unique_images.append(image)
 
         return unique_images, duplicate_images
 
-    def filter_images(self, images: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    def _quality_stream(self, images: List[Dict], quality_failed: List[Dict]) -> Iterator[Dict]:
         """
-        Filter a list of images, returning passed and failed images.
-        
-        Applies quality filters first, then duplicate detection on passed images.
+        Yield images passing the quality filters, appending failures to quality_failed.
         
         Args:
             images: List of image metadata dictionaries
-            
-        Returns:
-            Tuple of (passed_images: List[Dict], failed_images: List[Dict])
-            Each failed image includes a 'filter_reason' field explaining why it failed
+            quality_failed: List collecting failed images (with filter_reason/filter_stats)
         """
-        # First, apply quality filters (resolution, aspect ratio, format)
-        quality_passed = []
-        quality_failed = []
+        # Resolution and aspect ratio for the whole batch in one shot
+        dimensions_ok = self._check_dimensions_batch(images)
+
+        for image, dims_ok in zip(images, dimensions_ok):
+            if dims_ok and self._format_ok(image.get("path"), image.get("url")):
+                yield image
+                continue
 
-        for image in images:
+            # Failure: re-run the per-image checks for the detailed reason/stats
             filter_result = self.filter_image(image)
 
             if filter_result["passed"]:
-                quality_passed.append(image)
+                yield image
             else:
                 # Add filter reason to failed image
                 failed_image = image.copy()
@@ -431,6 +769,24 @@ class ImageQualityFilter:
                 failed_image["filter_stats"] = filter_result["stats"]
                 quality_failed.append(failed_image)
 
+    def filter_images(self, images: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Filter a list of images, returning passed and failed images.
+        
+        Applies quality filters first, then duplicate detection on passed images.
+        
+        Args:
+            images: List of image metadata dictionaries
+            
+        Returns:
+            Tuple of (passed_images: List[Dict], failed_images: List[Dict])
+            Each failed image includes a 'filter_reason' field explaining why it failed
+        """
+        # First, apply quality filters (resolution, aspect ratio, format);
+        # passing images stream straight into duplicate detection
+        quality_failed = []
+        quality_passed = self._quality_stream(images, quality_failed)
+
         # Then, detect duplicates among quality-passed images
         unique_images, duplicate_images = self._detect_duplicates(quality_passed)
 
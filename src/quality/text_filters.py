@@ -5,26 +5,38 @@ This module provides text quality filters to ensure crawled content
 meets minimum quality standards before being included in the corpus.
 """
 
+import hashlib
 import logging
 import re
-from typing import Dict, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from src.config import TextQualityConfig
 
 logger = logging.getLogger(__name__)
 
+# Optional google-re2 backend for word tokenization
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Common English stop words to exclude from repetition calculation
 # These are function words that naturally appear frequently in any text
-COMMON_WORDS = {
+COMMON_WORDS = frozenset({
     # Articles
     'a', 'an', 'the',
     # Pronouns
     'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-    'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her', 'its', 'our', 'their',
+    'this', 'that', 'these', 'those', 'my', 'your', 'his', 'its', 'our', 'their',
     # Prepositions
     'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'up', 'about', 'into',
     'through', 'during', 'including', 'against', 'among', 'throughout', 'despite',
-    'towards', 'upon', 'concerning', 'to', 'of', 'in', 'for', 'on', 'with', 'at',
+    'towards', 'upon', 'concerning',
     # Conjunctions
     'and', 'or', 'but', 'if', 'because', 'as', 'since', 'while', 'although', 'though',
     # Common verbs (forms of be, have, do)
@@ -34,17 +46,65 @@ COMMON_WORDS = {
     'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'cannot',
     # Common adverbs
     'not', 'no', 'yes', 'very', 'too', 'also', 'just', 'only', 'even', 'still', 'yet',
-    'more', 'most', 'less', 'least', 'so', 'such', 'well', 'much', 'many', 'more',
+    'more', 'most', 'less', 'least', 'so', 'such', 'well', 'much', 'many',
     # Question words
     'what', 'when', 'where', 'who', 'why', 'how', 'which', 'whose', 'whom',
     # Other common words
     'all', 'each', 'every', 'both', 'few', 'other', 'another', 'some', 'any', 'same',
-    'own', 'than', 'then', 'there', 'here', 'where', 'when', 'why', 'how',
-}
+    'own', 'than', 'then', 'there', 'here',
+})
 
 # Minimum content words required for meaningful repetition check
 MIN_CONTENT_WORDS = 10
 
+# Minimum words for reliable language detection
+MIN_WORDS_FOR_LANGUAGE_DETECTION = 10
+
+
+def _cannot_have_words(text: str, min_words: int) -> bool:
+    """
+    Cheap pre-screen: True if text is too short to contain min_words words.
+    
+    N words need at least N characters plus N-1 separators, so anything
+    shorter than 2N-1 characters is rejected without tokenizing.
+    """
+    return len(text) < 2 * min_words - 1
+
+# Pre-compiled patterns for the per-document hot path
+# Word tokens: alphanumeric sequences
+_WORD_RE = re.compile(r'\w+')
+# Same tokens for google-re2 (its \w is ASCII-only, so spell out Unicode classes)
+_RE2_WORD_PATTERN = r'[\pL\pN_]+'
+# Per-position multipliers for the 64-bit polynomial n-gram hash (powers of
+# a large odd prime mod 2**64; ngram_size is at most 10)
+_NGRAM_HASH_MULTIPLIERS = np.array(
+    [pow(0x100000001B3, k, 1 << 64) for k in range(10)], dtype=np.uint64
+)
+
+# ASCII fast path: map every non-word ASCII character to a space, so
+# str.split() yields exactly the \w+ tokens of an ASCII-only text
+_ASCII_NONWORD = str.maketrans({
+    c: ' ' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')
+})
+# Sequences of 3+ repeated characters (aaa, !!!, 111, etc.)
+_REPEAT_RE = re.compile(r'(.)\1{2,}')
+
+
+# Per-process filter for filter_batch workers (built once by the pool initializer,
+# so each worker loads its language detector and KenLM model only once)
+_WORKER_FILTER = None
+
+
+def _init_worker_filter(config: TextQualityConfig):
+    """ProcessPoolExecutor initializer: build this worker's TextQualityFilter."""
+    global _WORKER_FILTER
+    _WORKER_FILTER = TextQualityFilter(config)
+
+
+def _filter_chunk_in_worker(texts: List[str]) -> List[Dict]:
+    """Filter one chunk of documents in a worker process."""
+    return _WORKER_FILTER.filter_batch(texts)
+
 
 class TextQualityFilter:
     """
@@ -66,18 +126,91 @@ class TextQualityFilter:
             config: TextQualityConfig instance with filter parameters
         """
         self.config = config
+        # filter() results keyed by content hash, for exact-duplicate documents
+        self._filter_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._init_word_regex()
         self._init_language_detector()
         self._init_kenlm_model()
 
+    def _init_word_regex(self):
+        """Select the regex engine used by _split_words."""
+        self._word_re = _WORD_RE
+        if self.config.regex_backend == "re2":
+            if RE2_AVAILABLE:
+                self._word_re = re2.compile(_RE2_WORD_PATTERN)
+            else:
+                logger.warning("google-re2 not available, using stdlib re for tokenization. Install with: pip install google-re2")
+
     def _init_language_detector(self):
-        """Initialize language detector with seed for reproducibility."""
-        try:
-            from langdetect import DetectorFactory
-            DetectorFactory.seed = 0
-            self._langdetect_available = True
-        except ImportError:
-            logger.warning("langdetect not available, language filtering will be skipped")
-            self._langdetect_available = False
+        """
+        Initialize the fastest available language detector.
+        
+        Tries fastText (if a model path is configured), then lingua, then
+        langdetect (seeded for reproducibility).
+        """
+        self._language_backend = None
+        self._fasttext_model = None
+        self._lingua_detector = None
+
+        if self.config.fasttext_lid_model_path:
+            try:
+                import fasttext
+                import pathlib
+
+                model_path = pathlib.Path(self.config.fasttext_lid_model_path)
+                if not model_path.is_absolute():
+                    # Try relative to project root
+                    model_path = pathlib.Path(__file__).resolve().parents[2] / model_path
+
+                if model_path.exists():
+                    self._fasttext_model = fasttext.load_model(str(model_path))
+                    self._language_backend = "fasttext"
+                else:
+                    logger.warning(f"fastText language model not found: {model_path}, trying other detectors")
+            except ImportError:
+                logger.warning("fasttext not available, trying other language detectors. Install with: pip install fasttext")
+            except Exception as e:
+                logger.warning(f"Failed to load fastText language model: {e}, trying other detectors")
+
+        if self._language_backend is None:
+            try:
+                from lingua import LanguageDetectorBuilder
+                self._lingua_detector = LanguageDetectorBuilder.from_all_languages().build()
+                self._language_backend = "lingua"
+            except ImportError:
+                pass
+
+        if self._language_backend is None:
+            try:
+                from langdetect import DetectorFactory
+                DetectorFactory.seed = 0
+                self._language_backend = "langdetect"
+            except ImportError:
+                logger.warning("langdetect not available, language filtering will be skipped")
+
+        self._langdetect_available = self._language_backend is not None
+
+    def _detect_language(self, text: str) -> str:
+        """
+        Detect the language of text with the selected backend.
+        
+        Args:
+            text: Input text (already truncated)
+            
+        Returns:
+            ISO 639-1 language code (e.g. "en"), or "unknown" if undetermined
+        """
+        if self._language_backend == "fasttext":
+            # fastText predicts per line, so flatten newlines
+            labels, _ = self._fasttext_model.predict(text.replace("\n", " "), k=1)
+            return labels[0].removeprefix("__label__")
+
+        if self._language_backend == "lingua":
+            language = self._lingua_detector.detect_language_of(text)
+            return language.iso_code_639_1.name.lower() if language is not None else "unknown"
+
+        from langdetect import detect
+        return detect(text)
 
     def _init_kenlm_model(self):
         """Initialize KenLM language model for perplexity calculation."""
@@ -144,23 +277,47 @@ class TextQualityFilter:
         Returns:
             List of words (non-empty strings)
         """
+        text = text.lower()
+        if text.isascii():
+            # Most crawl pages are plain ASCII: translate + split beats the regex engine
+            return text.translate(_ASCII_NONWORD).split()
         # Use regex to split on whitespace and punctuation
-        # Keep only alphanumeric sequences
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [w for w in words if w]  # Filter out empty strings
+        # Keep only alphanumeric sequences (findall never yields empty matches)
+        return self._word_re.findall(text)
 
-    def check_word_count(self, text: str) -> Tuple[bool, Dict]:
+    def _count_words(self, text: str) -> Tuple[int, int]:
+        """
+        Count words and their total characters without building a word list.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Tuple of (word_count, total_chars), matching _split_words(text)
+        """
+        word_count = 0
+        total_chars = 0
+        for match in self._word_re.finditer(text.lower()):
+            word_count += 1
+            total_chars += match.end() - match.start()
+        return word_count, total_chars
+
+    def check_word_count(self, text: str, words: Optional[List[str]] = None) -> Tuple[bool, Dict]:
         """
         Check if text meets word count requirements.
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (passed: bool, stats: dict)
         """
-        words = self._split_words(text)
-        word_count = len(words)
+        if words is None:
+            # Only the count is needed, so stream matches instead of splitting
+            word_count, _ = self._count_words(text)
+        else:
+            word_count = len(words)
 
         passed = self.config.min_words <= word_count <= self.config.max_words
 
@@ -172,27 +329,32 @@ class TextQualityFilter:
 
         return passed, stats
 
-    def check_avg_word_length(self, text: str) -> Tuple[bool, Dict]:
+    def check_avg_word_length(self, text: str, words: Optional[List[str]] = None) -> Tuple[bool, Dict]:
         """
         Check if text meets average word length requirements.
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (passed: bool, stats: dict)
         """
-        words = self._split_words(text)
-
-        if not words:
+        if words is None:
+            # Only counts are needed, so stream matches instead of splitting
+            word_count, total_chars = self._count_words(text)
+        else:
+            word_count = len(words)
+            total_chars = sum(map(len, words))
+
+        if not word_count:
             return False, {
                 "avg_word_length": 0.0,
                 "min_required": self.config.min_avg_word_length,
                 "reason": "no_words"
             }
 
-        total_chars = sum(len(word) for word in words)
-        avg_length = total_chars / len(words)
+        avg_length = total_chars / word_count
 
         passed = avg_length >= self.config.min_avg_word_length
 
@@ -203,12 +365,13 @@ class TextQualityFilter:
 
         return passed, stats
 
-    def check_language(self, text: str) -> Tuple[bool, Dict]:
+    def check_language(self, text: str, words: Optional[List[str]] = None) -> Tuple[bool, Dict]:
         """
         Check if text matches the expected language.
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (passed: bool, stats: dict)
@@ -222,8 +385,12 @@ class TextQualityFilter:
             }
 
         # Need minimum text length for reliable detection
-        words = self._split_words(text)
-        if len(words) < 10:
+        if words is None:
+            if _cannot_have_words(text, MIN_WORDS_FOR_LANGUAGE_DETECTION):
+                words = []
+            else:
+                words = self._split_words(text)
+        if len(words) < MIN_WORDS_FOR_LANGUAGE_DETECTION:
             # Too short for reliable detection, pass it
             return True, {
                 "detected_language": "unknown",
@@ -232,9 +399,12 @@ class TextQualityFilter:
             }
 
         try:
-            from langdetect import detect
+            # The first few hundred words are enough for a reliable guess
+            max_words = self.config.language_detection_max_words
+            if len(words) > max_words:
+                text = " ".join(text.split(maxsplit=max_words)[:max_words])
 
-            detected_lang = detect(text)
+            detected_lang = self._detect_language(text)
             passed = detected_lang == self.config.language
 
             stats = {
@@ -269,25 +439,27 @@ class TextQualityFilter:
         if len(text) < 10:
             return 0.0, {"char_repetition_ratio": 0.0, "reason": "text_too_short"}
 
-        # Find sequences of 3+ repeated characters
-        # Pattern matches: aaa, !!!, 111, etc.
-        repeated_char_pattern = re.compile(r'(.)\1{2,}')
-        matches = repeated_char_pattern.findall(text)
-
-        # Calculate total length of repeated sequences
-        total_repeated_chars = sum(len(match.group(0)) for match in repeated_char_pattern.finditer(text))
+        # Find sequences of 3+ repeated characters and their total length in one pass
+        sequence_count = 0
+        total_repeated_chars = 0
+        for match in _REPEAT_RE.finditer(text):
+            sequence_count += 1
+            total_repeated_chars += match.end() - match.start()
         total_chars = len(text)
         repetition_ratio = total_repeated_chars / total_chars if total_chars > 0 else 0.0
 
         stats = {
             "char_repetition_ratio": round(repetition_ratio, 3),
-            "repeated_char_sequences": len(matches),
-            "total_repeated_chars": total_repeated_chars,
         }
 
+        # Diagnostic details only when asked for, or to explain a failure
+        if self.config.verbose_stats or repetition_ratio > self.config.max_char_repetition_ratio:
+            stats["repeated_char_sequences"] = sequence_count
+            stats["total_repeated_chars"] = total_repeated_chars
+
         return repetition_ratio, stats
 
-    def _check_word_repetition(self, text: str) -> Tuple[float, Dict]:
+    def _check_word_repetition(self, text: str, words: Optional[List[str]] = None) -> Tuple[float, Dict]:
         """
         Check for excessive word-level repetition.
         
@@ -296,55 +468,58 @@ class TextQualityFilter:
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (repetition_ratio: float, stats: dict)
         """
-        words = self._split_words(text)
+        if words is None:
+            words = self._split_words(text)
 
         if len(words) < 5:
             return 0.0, {"word_repetition_ratio": 0.0, "reason": "too_few_words"}
 
-        # Filter out common words (stop words) - only analyze content words
-        content_words = [w for w in words if w not in COMMON_WORDS]
-        common_word_count = len(words) - len(content_words)
+        # Count word frequencies, filtering out common words (stop words) -
+        # only content words are analyzed
+        stop_words = COMMON_WORDS
+        word_counts = Counter(w for w in words if w not in stop_words)
+        total_content_words = sum(word_counts.values())
+        common_word_count = len(words) - total_content_words
 
-        if len(content_words) < MIN_CONTENT_WORDS:
+        if total_content_words < MIN_CONTENT_WORDS:
             # Too few content words for meaningful analysis
             return 0.0, {
                 "word_repetition_ratio": 0.0,
                 "reason": "too_few_content_words",
-                "content_words": len(content_words),
+                "content_words": total_content_words,
                 "total_words": len(words)
             }
 
-        # Count word frequencies (only for content words)
-        word_counts = {}
-        for word in content_words:
-            word_counts[word] = word_counts.get(word, 0) + 1
-
         # Count duplicate content words (words that appear more than once)
-        duplicate_words = sum(count - 1 for count in word_counts.values() if count > 1)
-        total_content_words = len(content_words)
+        duplicate_words = total_content_words - len(word_counts)
         repetition_ratio = duplicate_words / total_content_words if total_content_words > 0 else 0.0
 
-        # Find most repeated content word
-        most_repeated = max(word_counts.items(), key=lambda x: x[1]) if word_counts else ("", 0)
-
         stats = {
             "word_repetition_ratio": round(repetition_ratio, 3),
-            "unique_words": len(word_counts),
             "total_words": len(words),
             "content_words": total_content_words,
-            "common_words": common_word_count,
-            "duplicate_word_count": duplicate_words,
-            "most_repeated_word": most_repeated[0],
-            "most_repeated_count": most_repeated[1],
         }
 
+        # Diagnostic details only when asked for, or to explain a failure
+        if self.config.verbose_stats or repetition_ratio > self.config.max_word_repetition_ratio:
+            # Find most repeated content word
+            most_repeated = word_counts.most_common(1)[0] if word_counts else ("", 0)
+            stats.update({
+                "unique_words": len(word_counts),
+                "common_words": common_word_count,
+                "duplicate_word_count": duplicate_words,
+                "most_repeated_word": most_repeated[0],
+                "most_repeated_count": most_repeated[1],
+            })
+
         return repetition_ratio, stats
 
-    def _check_ngram_repetition(self, text: str) -> Tuple[int, Dict]:
+    def _check_ngram_repetition(self, text: str, words: Optional[List[str]] = None) -> Tuple[int, Dict]:
         """
         Check for excessive n-gram repetition.
         
@@ -352,45 +527,49 @@ class TextQualityFilter:
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (max_repetition_count: int, stats: dict)
         """
-        words = self._split_words(text)
+        if words is None:
+            words = self._split_words(text)
         ngram_size = self.config.ngram_size
 
         if len(words) < ngram_size * 2:
             return 0, {"max_ngram_repetition": 0, "reason": "too_few_words_for_ngrams"}
 
-        # Generate n-grams
-        ngrams = []
-        for i in range(len(words) - ngram_size + 1):
-            ngram = tuple(words[i:i + ngram_size])
-            ngrams.append(ngram)
-
-        # Count n-gram frequencies
-        ngram_counts = {}
-        for ngram in ngrams:
-            ngram_counts[ngram] = ngram_counts.get(ngram, 0) + 1
-
-        # Find maximum repetition count
-        max_repetition = max(ngram_counts.values()) if ngram_counts else 0
-
-        # Find most repeated n-gram
-        most_repeated_ngram = max(ngram_counts.items(), key=lambda x: x[1]) if ngram_counts else ((), 0)
+        # Hash each word once, combine word hashes into one 64-bit hash per
+        # n-gram with NumPy, then count with a sort-based np.unique instead
+        # of hashing n-gram strings in a dict
+        total_ngrams = len(words) - ngram_size + 1
+        word_hashes = np.fromiter(map(hash, words), dtype=np.int64, count=len(words)).view(np.uint64)
+        ngram_hashes = word_hashes[:total_ngrams] * _NGRAM_HASH_MULTIPLIERS[0]
+        for k in range(1, ngram_size):
+            ngram_hashes += word_hashes[k:k + total_ngrams] * _NGRAM_HASH_MULTIPLIERS[k]
+        unique_hashes, counts = np.unique(ngram_hashes, return_counts=True)
+        max_repetition = int(counts.max())
 
         stats = {
             "max_ngram_repetition": max_repetition,
             "ngram_size": ngram_size,
-            "total_ngrams": len(ngrams),
-            "unique_ngrams": len(ngram_counts),
-            "most_repeated_ngram": " ".join(most_repeated_ngram[0]) if most_repeated_ngram[0] else "",
-            "most_repeated_ngram_count": most_repeated_ngram[1],
         }
 
+        # Diagnostic details only when asked for, or to explain a failure
+        if self.config.verbose_stats or max_repetition > self.config.max_ngram_repetition:
+            # Most repeated n-gram: the earliest one among those with the max count
+            top_hashes = unique_hashes[counts == max_repetition]
+            first = int(np.flatnonzero(np.isin(ngram_hashes, top_hashes))[0])
+            stats.update({
+                "total_ngrams": total_ngrams,
+                "unique_ngrams": len(unique_hashes),
+                "most_repeated_ngram": " ".join(words[first:first + ngram_size]),
+                "most_repeated_ngram_count": max_repetition,
+            })
+
         return max_repetition, stats
 
-    def check_repetition(self, text: str) -> Tuple[bool, Dict]:
+    def check_repetition(self, text: str, words: Optional[List[str]] = None) -> Tuple[bool, Dict]:
         """
         Check for excessive repetition at multiple levels.
         
@@ -398,11 +577,13 @@ class TextQualityFilter:
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (passed: bool, stats: dict)
         """
-        words = self._split_words(text)
+        if words is None:
+            words = self._split_words(text)
 
         # Skip repetition check for very short texts
         if len(words) < self.config.min_text_length_for_repetition_check:
@@ -423,7 +604,7 @@ class TextQualityFilter:
             }
 
         # Check word repetition
-        word_repetition_ratio, word_stats = self._check_word_repetition(text)
+        word_repetition_ratio, word_stats = self._check_word_repetition(text, words)
         all_stats.update(word_stats)
         if word_repetition_ratio > self.config.max_word_repetition_ratio:
             return False, {
@@ -432,7 +613,7 @@ class TextQualityFilter:
             }
 
         # Check n-gram repetition
-        max_ngram_repetition, ngram_stats = self._check_ngram_repetition(text)
+        max_ngram_repetition, ngram_stats = self._check_ngram_repetition(text, words)
         all_stats.update(ngram_stats)
         if max_ngram_repetition > self.config.max_ngram_repetition:
             return False, {
@@ -443,7 +624,7 @@ class TextQualityFilter:
         # All repetition checks passed
         return True, all_stats
 
-    def check_perplexity(self, text: str) -> Tuple[bool, Dict]:
+    def check_perplexity(self, text: str, words: Optional[List[str]] = None) -> Tuple[bool, Dict]:
         """
         Check text quality using perplexity score from KenLM language model.
         
@@ -453,6 +634,7 @@ class TextQualityFilter:
         
         Args:
             text: Input text to check
+            words: Pre-split words of text (computed if not given)
             
         Returns:
             Tuple of (passed: bool, stats: dict)
@@ -470,7 +652,13 @@ class TextQualityFilter:
                 "reason": "kenlm_model_not_available"
             }
 
-        words = self._split_words(text)
+        if words is None:
+            if _cannot_have_words(text, self.config.min_text_length_for_perplexity):
+                return True, {
+                    "perplexity": None,
+                    "reason": f"text_too_short: {len(text)} chars (min: {self.config.min_text_length_for_perplexity} words)"
+                }
+            words = self._split_words(text)
 
         if len(words) < self.config.min_text_length_for_perplexity:
             return True, {
@@ -529,10 +717,160 @@ class TextQualityFilter:
                 "stats": {}
             }
 
+        cache_key = self._filter_cache_key(normalized_text)
+        cached = self._filter_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Tokenize once; every check below reuses the same word list
+        words = self._split_words(normalized_text)
         all_stats = {}
 
+        result = self._apply_filters_before_perplexity(normalized_text, words, all_stats)
+        if result is None:
+            result = self._apply_perplexity_filter(normalized_text, words, all_stats)
+
+        self._filter_cache_put(cache_key, result)
+        return result
+
+    def filter_batch(self, texts: List[str], n_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Apply all text quality filters to a batch of documents.
+        
+        Same results as calling filter() on each text, but the cheap checks
+        run over the whole batch first, so KenLM perplexity is computed only
+        for the texts that pass them.
+        
+        Args:
+            texts: Texts to filter
+            n_workers: If > 1, split the batch across this many worker
+                processes (tokenization and language detection hold the GIL,
+                so threads would not help); worth it only for large batches
+            
+        Returns:
+            One filter() result dictionary per text, in input order
+        """
+        if n_workers is not None and n_workers > 1 and len(texts) > 1:
+            return self._filter_batch_parallel(texts, n_workers)
+
+        results: List[Optional[Dict]] = [None] * len(texts)
+        pending = []
+
+        for idx, text in enumerate(texts):
+            normalized_text = self._normalize_text(text)
+            if not normalized_text:
+                results[idx] = {
+                    "passed": False,
+                    "reason": "empty_text",
+                    "stats": {}
+                }
+                continue
+
+            cache_key = self._filter_cache_key(normalized_text)
+            cached = self._filter_cache_get(cache_key)
+            if cached is not None:
+                results[idx] = cached
+                continue
+
+            words = self._split_words(normalized_text)
+            all_stats = {}
+            failed = self._apply_filters_before_perplexity(normalized_text, words, all_stats)
+            if failed is not None:
+                results[idx] = failed
+                self._filter_cache_put(cache_key, failed)
+            else:
+                pending.append((idx, cache_key, normalized_text, words, all_stats))
+
+        for idx, cache_key, normalized_text, words, all_stats in pending:
+            results[idx] = self._apply_perplexity_filter(normalized_text, words, all_stats)
+            self._filter_cache_put(cache_key, results[idx])
+
+        return results
+
+    def _filter_batch_parallel(self, texts: List[str], n_workers: int) -> List[Dict]:
+        """Run filter_batch over chunks of texts in a process pool, keeping input order."""
+        # A few chunks per worker balances load while amortizing IPC
+        chunk_size = max(1, len(texts) // (n_workers * 4))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        results: List[Dict] = []
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker_filter,
+            initargs=(self.config,),
+        ) as pool:
+            for chunk_results in pool.map(_filter_chunk_in_worker, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def _filter_cache_key(self, normalized_text: str) -> Optional[bytes]:
+        """Content hash of a document (None when the result cache is disabled)."""
+        if self.config.filter_cache_size <= 0:
+            return None
+        return hashlib.blake2b(normalized_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _filter_cache_get(self, key: Optional[bytes]) -> Optional[Dict]:
+        """Return a copy of a cached filter() result, marking it recently used."""
+        if key is None:
+            return None
+        result = self._filter_cache.get(key)
+        if result is None:
+            return None
+        self._filter_cache.move_to_end(key)
+        return {**result, "stats": dict(result["stats"])}
+
+    def _filter_cache_put(self, key: Optional[bytes], result: Dict):
+        """Cache a filter() result, evicting the least recently used entries."""
+        if key is None:
+            return
+        self._filter_cache[key] = {**result, "stats": dict(result["stats"])}
+        while len(self._filter_cache) > self.config.filter_cache_size:
+            self._filter_cache.popitem(last=False)
+
+    def _apply_perplexity_filter(self, text: str, words: List[str], all_stats: Dict) -> Dict:
+        """
+        Run the perplexity check on a document that passed all other filters.
+        
+        Args:
+            text: Normalized text
+            words: Pre-split words of text
+            all_stats: Statistics collected so far (updated in place)
+            
+        Returns:
+            Final filter result dictionary
+        """
+        perplexity_passed, perplexity_stats = self.check_perplexity(text, words)
+        all_stats.update(perplexity_stats)
+        if not perplexity_passed:
+            perplexity = perplexity_stats.get("perplexity", 0.0)
+            max_perplexity = perplexity_stats.get("max_perplexity", 0.0)
+            return {
+                "passed": False,
+                "reason": f"perplexity_too_high: {perplexity:.2f} (max: {max_perplexity:.2f})",
+                "stats": all_stats
+            }
+
+        # All checks passed
+        return {
+            "passed": True,
+            "reason": "passed",
+            "stats": all_stats
+        }
+
+    def _apply_filters_before_perplexity(self, normalized_text: str, words: List[str], all_stats: Dict) -> Optional[Dict]:
+        """
+        Run every check except perplexity, stopping at the first failure.
+        
+        Args:
+            normalized_text: Normalized, non-empty text
+            words: Pre-split words of the text
+            all_stats: Statistics dict to fill (updated in place)
+            
+        Returns:
+            Failure result dictionary, or None if all checks passed
+        """
         # Check word count
-        word_count_passed, word_stats = self.check_word_count(normalized_text)
+        word_count_passed, word_stats = self.check_word_count(normalized_text, words)
         all_stats.update(word_stats)
         if not word_count_passed:
             word_count = word_stats.get("word_count", 0)
@@ -551,7 +889,7 @@ class TextQualityFilter:
             }
 
         # Check average word length
-        avg_length_passed, length_stats = self.check_avg_word_length(normalized_text)
+        avg_length_passed, length_stats = self.check_avg_word_length(normalized_text, words)
         all_stats.update(length_stats)
         if not avg_length_passed:
             avg_length = length_stats.get("avg_word_length", 0.0)
@@ -562,20 +900,8 @@ class TextQualityFilter:
                 "stats": all_stats
             }
 
-        # Check language
-        lang_passed, lang_stats = self.check_language(normalized_text)
-        all_stats.update(lang_stats)
-        if not lang_passed:
-            detected = lang_stats.get("detected_language", "unknown")
-            expected = lang_stats.get("expected_language", "unknown")
-            return {
-                "passed": False,
-                "reason": f"language_failed: detected '{detected}' (expected: '{expected}')",
-                "stats": all_stats
-            }
-
-        # Check repetition
-        repetition_passed, repetition_stats = self.check_repetition(normalized_text)
+        # Check repetition (regex and counting only) before the slower language detection
+        repetition_passed, repetition_stats = self.check_repetition(normalized_text, words)
         all_stats.update(repetition_stats)
         if not repetition_passed:
             reason = repetition_stats.get("reason", "repetition_failed")
@@ -585,21 +911,17 @@ class TextQualityFilter:
                 "stats": all_stats
             }
 
-        # Check perplexity (KenLM)
-        perplexity_passed, perplexity_stats = self.check_perplexity(normalized_text)
-        all_stats.update(perplexity_stats)
-        if not perplexity_passed:
-            perplexity = perplexity_stats.get("perplexity", 0.0)
-            max_perplexity = perplexity_stats.get("max_perplexity", 0.0)
+        # Check language
+        lang_passed, lang_stats = self.check_language(normalized_text, words)
+        all_stats.update(lang_stats)
+        if not lang_passed:
+            detected = lang_stats.get("detected_language", "unknown")
+            expected = lang_stats.get("expected_language", "unknown")
             return {
                 "passed": False,
-                "reason": f"perplexity_too_high: {perplexity:.2f} (max: {max_perplexity:.2f})",
+                "reason": f"language_failed: detected '{detected}' (expected: '{expected}')",
                 "stats": all_stats
             }
 
-        # All checks passed
-        return {
-            "passed": True,
-            "reason": "passed",
-            "stats": all_stats
-        }
+        # Cheap checks passed; perplexity (KenLM) is applied by the caller
+        return None
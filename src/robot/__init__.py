@@ -11,8 +11,17 @@ from src.robot.action_extractor import ActionExtractor
 
 # Try to import MuJoCo simulator (optional dependency)
 try:
-    from src.robot.mujoco_simulator import MuJoCoSimulator, simulate_actions_from_document
-    __all__ = ["ActionExtractor", "MuJoCoSimulator", "simulate_actions_from_document"]
+    from src.robot.mujoco_simulator import (
+        MuJoCoSimulator,
+        simulate_actions_from_document,
+        simulate_actions_from_documents,
+    )
+    __all__ = [
+        "ActionExtractor",
+        "MuJoCoSimulator",
+        "simulate_actions_from_document",
+        "simulate_actions_from_documents",
+    ]
 except ImportError:
     # MuJoCo not available, only export ActionExtractor
     __all__ = ["ActionExtractor"]
@@ -8,12 +8,22 @@ Converts text cleaning steps into structured robot actions with:
 - Tool requirements
 """
 
+import functools
+import os
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Optional Aho-Corasick automaton for single-pass keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # Action type keywords
 ACTION_TYPE_KEYWORDS = {
@@ -38,14 +48,15 @@ FORCE_KEYWORDS = {
     "light": ["light", "soft", "minimal", "slight"],
 }
 
-# Duration/time patterns
-TIME_PATTERNS = [
-    re.compile(r'(\d+)\s*(?:minute|min|m)\s*(?:s)?', re.IGNORECASE),
-    re.compile(r'(\d+)\s*(?:second|sec|s)\s*(?:s)?', re.IGNORECASE),
-    re.compile(r'(\d+)\s*(?:hour|hr|h)\s*(?:s)?', re.IGNORECASE),
-    re.compile(r'for\s+(\d+)\s*(?:minute|min|m)', re.IGNORECASE),
-    re.compile(r'(\d+)\s*-\s*(\d+)\s*(?:minute|min|m)', re.IGNORECASE),  # Range
-]
+# Duration/time pattern: a number followed by a minute, second or hour unit,
+# with the unit recorded in a named group (m, s or h)
+DURATION_RE = re.compile(
+    r'(\d+)\s*(?:(?P<m>minute|min|m)|(?P<s>second|sec|s)|(?P<h>hour|hr|h))',
+    re.IGNORECASE,
+)
+
+# Seconds per unit group in DURATION_RE
+DURATION_UNIT_SECONDS = {"m": 60, "s": 1, "h": 3600}
 
 # Tool keywords (mapping to robot-compatible tool names)
 TOOL_MAPPING = {
@@ -59,6 +70,59 @@ TOOL_MAPPING = {
     "detergent": ["detergent", "soap", "cleaning solution", "cleaner"],
 }
 
+# Motion pattern keywords (checked in order, first match wins)
+PATTERN_KEYWORDS = {
+    "circular": ["circular", "circle", "round"],
+    "back_and_forth": ["back and forth", "backward and forward", "side to side"],
+    "vertical": ["up and down", "vertical"],
+    "horizontal": ["horizontal", "left to right"],
+    "gentle": ["gentle", "light"],
+}
+
+# Phrases indicating an immediate (zero duration) step
+IMMEDIATE_KEYWORDS = ["immediately", "right away", "right now", "instantly"]
+
+# Action types in priority order, and the indexes of the types each keyword
+# counts towards (a keyword may serve several types)
+_ACTION_TYPES: Tuple[str, ...] = tuple(ACTION_TYPE_KEYWORDS)
+_WAIT_INDEX = _ACTION_TYPES.index("wait")
+_ACTION_INDEXES_BY_KEYWORD: Dict[str, Tuple[int, ...]] = {}
+for _index, _keywords in enumerate(ACTION_TYPE_KEYWORDS.values()):
+    for _keyword in _keywords:
+        _ACTION_INDEXES_BY_KEYWORD[_keyword] = _ACTION_INDEXES_BY_KEYWORD.get(_keyword, ()) + (_index,)
+
+# Every keyword the extractor tests for, in first-seen order
+_ALL_KEYWORDS: Tuple[str, ...] = tuple(dict.fromkeys(
+    keyword
+    for table in (ACTION_TYPE_KEYWORDS, TOOL_MAPPING, FORCE_KEYWORDS, PATTERN_KEYWORDS)
+    for keywords in table.values()
+    for keyword in keywords
+)) + tuple(IMMEDIATE_KEYWORDS)
+
+
+@functools.cache
+def _keyword_automaton():
+    """Build the Aho-Corasick automaton over every keyword the extractor tests."""
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_keywords(text: str) -> FrozenSet[str]:
+    """
+    Return every keyword occurring in text.
+
+    Matches are plain substrings (overlapping ones included), so membership
+    in the result is equivalent to ``keyword in text``. With pyahocorasick
+    installed this is a single pass over the text; otherwise each keyword is
+    tested in turn.
+    """
+    if AHOCORASICK_AVAILABLE:
+        return frozenset(keyword for _, keyword in _keyword_automaton().iter(text))
+    return frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in text)
+
 
 class ActionExtractor:
     """
@@ -82,6 +146,7 @@ class ActionExtractor:
         default_force: float = 5.0,
         default_duration: int = 30,
         min_confidence: float = 0.3,
+        cache_size: int = 65536,
     ):
         """
         Initialize the action extractor.
@@ -90,10 +155,29 @@ class ActionExtractor:
             default_force: Default force value (0-10 scale) if not specified
             default_duration: Default duration in seconds if not specified
             min_confidence: Minimum confidence threshold for action extraction
+            cache_size: Number of distinct normalized steps whose extracted
+                fields are cached (0 disables caching)
         """
         self.default_force = default_force
         self.default_duration = default_duration
         self.min_confidence = min_confidence
+        self.cache_size = cache_size
+        self._init_cache()
+
+    def _init_cache(self) -> None:
+        """Build the per-instance cache of extracted step fields."""
+        # Corpora repeat many steps verbatim; cache the per-step fields
+        self._cached_fields = functools.lru_cache(maxsize=self.cache_size)(self._compute_fields)
+
+    def __getstate__(self) -> Dict:
+        # lru_cache wrappers are not picklable; workers rebuild an empty cache
+        state = self.__dict__.copy()
+        del state["_cached_fields"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._init_cache()
 
     def extract_action(self, step_text: str, step_order: int = 1) -> Optional[Dict]:
         """
@@ -110,21 +194,7 @@ class ActionExtractor:
             return None
 
         step_lower = step_text.lower().strip()
-
-        # Extract action type
-        action_type, action_confidence = self._extract_action_type(step_lower)
-
-        # Extract tool
-        tool = self._extract_tool(step_lower)
-
-        # Extract force/pressure
-        force = self._extract_force(step_lower)
-
-        # Extract duration
-        duration = self._extract_duration(step_lower)
-
-        # Extract motion pattern
-        pattern = self._extract_pattern(step_lower)
+        action_type, action_confidence, tool, force, duration, pattern = self._extract_fields(step_lower)
 
         # Calculate overall confidence
         confidence = self._calculate_confidence(
@@ -132,7 +202,7 @@ class ActionExtractor:
         )
 
         if confidence < self.min_confidence:
-            logger.debug(f"Low confidence ({confidence:.2f}) for step: {step_text[:50]}...")
+            logger.debug("Low confidence (%.2f) for step: %.50s...", confidence, step_text)
             return None
 
         action = {
@@ -148,6 +218,36 @@ class ActionExtractor:
 
         return action
 
+    def _extract_fields(
+        self, step_lower: str
+    ) -> Tuple[str, float, Optional[str], float, int, Optional[str]]:
+        """
+        Extract the text-derived action fields from a normalized step.
+        
+        Args:
+            step_lower: Lowercased, stripped step text
+            
+        Returns:
+            Tuple of (action_type, action_confidence, tool, force, duration, pattern)
+        """
+        # Force and duration fall back to the defaults, so they are part of the key
+        return self._cached_fields(step_lower, self.default_force, self.default_duration)
+
+    def _compute_fields(
+        self, step_lower: str, default_force: float, default_duration: int
+    ) -> Tuple[str, float, Optional[str], float, int, Optional[str]]:
+        """Uncached body of _extract_fields; the defaults only key the cache."""
+        # Find all keywords once and share them between the extractors
+        found = _find_keywords(step_lower)
+
+        action_type, action_confidence = self._extract_action_type(step_lower, found)
+        tool = self._extract_tool(step_lower, found)
+        force = self._extract_force(step_lower, found)
+        duration = self._extract_duration(step_lower, found)
+        pattern = self._extract_pattern(step_lower, found)
+
+        return action_type, action_confidence, tool, force, duration, pattern
+
     def extract_actions(self, steps: List[str]) -> List[Dict]:
         """
         Extract actions from a list of step texts.
@@ -158,91 +258,117 @@ class ActionExtractor:
         Returns:
             List of structured action dictionaries
         """
-        actions = []
+        actions = list(self.iter_actions(steps))
 
+        logger.info("Extracted %d/%d actions from steps", len(actions), len(steps))
+        return actions
+
+    def iter_actions(self, steps: Iterable[str]) -> Iterator[Dict]:
+        """
+        Extract actions from step texts lazily, one at a time.
+        
+        Args:
+            steps: Iterable of step text strings
+            
+        Yields:
+            Structured action dictionaries, in step order
+        """
         for idx, step in enumerate(steps, start=1):
             action = self.extract_action(step, step_order=idx)
             if action:
-                actions.append(action)
+                yield action
             else:
-                logger.debug(f"Failed to extract action from step {idx}: {step[:50]}...")
+                logger.debug("Failed to extract action from step %d: %.50s...", idx, step)
 
-        logger.info(f"Extracted {len(actions)}/{len(steps)} actions from steps")
-        return actions
-
-    def _extract_action_type(self, text: str) -> Tuple[str, float]:
+    def _extract_action_type(
+        self, text: str, found: Optional[FrozenSet[str]] = None
+    ) -> Tuple[str, float]:
         """
         Extract action type from text.
         
         Args:
             text: Lowercase step text
+            found: Keywords present in text (see ``_find_keywords``), if precomputed
             
         Returns:
             Tuple of (action_type, confidence)
         """
-        best_action = "apply"  # Default
-        best_confidence = 0.3
-        best_matches = 0
+        if found is None:
+            found = _find_keywords(text)
+
+        # Tally matches per action type (indexed as in _ACTION_TYPES) from the
+        # found keywords instead of re-testing each one
+        match_counts = [0] * len(_ACTION_TYPES)
+        for keyword in found:
+            for index in _ACTION_INDEXES_BY_KEYWORD.get(keyword, ()):
+                match_counts[index] += 1
 
         # Check for "wait" first (has priority, often contains other action words)
-        if any(keyword in text for keyword in ACTION_TYPE_KEYWORDS["wait"]):
+        if match_counts[_WAIT_INDEX]:
             return "wait", 0.8
 
-        for action_type, keywords in ACTION_TYPE_KEYWORDS.items():
-            if action_type == "wait":  # Already checked
-                continue
-            matches = sum(1 for keyword in keywords if keyword in text)
-            if matches > 0:
-                confidence = min(0.9, 0.4 + (matches * 0.15))
-                if matches > best_matches or (matches == best_matches and confidence > best_confidence):
-                    best_action = action_type
-                    best_confidence = confidence
-                    best_matches = matches
+        # Most matches wins; ties go to the type listed first
+        best_matches = max(match_counts)
+        if best_matches == 0:
+            return "apply", 0.3  # Default
 
-        return best_action, best_confidence
+        best_action = _ACTION_TYPES[match_counts.index(best_matches)]
+        return best_action, min(0.9, 0.4 + (best_matches * 0.15))
 
-    def _extract_tool(self, text: str) -> Optional[str]:
+    def _extract_tool(
+        self, text: str, found: Optional[FrozenSet[str]] = None
+    ) -> Optional[str]:
         """
         Extract tool requirement from text.
         
         Args:
             text: Lowercase step text
+            found: Keywords present in text (see ``_find_keywords``), if precomputed
             
         Returns:
             Tool name or None
         """
+        if found is None:
+            found = _find_keywords(text)
+
         # Check for explicit tool mentions
         for tool, keywords in TOOL_MAPPING.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in found:
                     return tool
 
         # Infer tool from action type
-        if "scrub" in text or "brush" in text:
+        if "scrub" in found or "brush" in found:
             return "brush"
-        elif "vacuum" in text:
+        elif "vacuum" in found:
             return "vacuum"
-        elif "spray" in text or "apply" in text:
+        elif "spray" in found or "apply" in found:
             return "spray_bottle"
-        elif "rinse" in text or "wash" in text:
+        elif "rinse" in found or "wash" in found:
             return "cloth"
 
         return None
 
-    def _extract_force(self, text: str) -> float:
+    def _extract_force(
+        self, text: str, found: Optional[FrozenSet[str]] = None
+    ) -> float:
         """
         Extract force/pressure specification from text.
         
         Args:
             text: Lowercase step text
+            found: Keywords present in text (see ``_find_keywords``), if precomputed
             
         Returns:
             Force value (0-10 scale, where 5.0 is moderate/default)
         """
+        if found is None:
+            found = _find_keywords(text)
+
         # Check for force keywords
         for force_level, keywords in FORCE_KEYWORDS.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in found:
                     if force_level == "gentle" or force_level == "light":
                         return 3.0
                     elif force_level == "moderate":
@@ -253,65 +379,58 @@ class ActionExtractor:
         # Default moderate force
         return self.default_force
 
-    def _extract_duration(self, text: str) -> int:
+    def _extract_duration(
+        self, text: str, found: Optional[FrozenSet[str]] = None
+    ) -> int:
         """
         Extract duration from text.
         
         Args:
             text: Lowercase step text
+            found: Keywords present in text (see ``_find_keywords``), if precomputed
             
         Returns:
             Duration in seconds
         """
-        # Try each time pattern
-        for pattern in TIME_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                groups = match.groups()
-                if len(groups) == 1:
-                    # Single value
-                    value = int(groups[0])
-                    # Determine unit from pattern
-                    if 'hour' in pattern.pattern or 'hr' in pattern.pattern or 'h' in pattern.pattern:
-                        return value * 3600
-                    elif 'minute' in pattern.pattern or 'min' in pattern.pattern or 'm' in pattern.pattern:
-                        return value * 60
-                    else:
-                        return value  # seconds
-                elif len(groups) == 2:
-                    # Range - take average
-                    min_val = int(groups[0])
-                    max_val = int(groups[1])
-                    avg = (min_val + max_val) // 2
-                    return avg * 60  # Assume minutes
+        # Scan once for number/unit pairs. Minutes win over seconds, and
+        # seconds over hours; within a unit the first mention wins.
+        first_by_unit: Dict[str, re.Match] = {}
+        for match in DURATION_RE.finditer(text):
+            unit = match.lastgroup
+            if unit == "m":
+                return int(match.group(1)) * DURATION_UNIT_SECONDS["m"]
+            first_by_unit.setdefault(unit, match)
+        for unit in ("s", "h"):
+            if unit in first_by_unit:
+                return int(first_by_unit[unit].group(1)) * DURATION_UNIT_SECONDS[unit]
 
         # Check for "immediately" or "right away" (0 duration)
-        if any(word in text for word in ["immediately", "right away", "right now", "instantly"]):
+        if found is None:
+            found = _find_keywords(text)
+        if any(word in found for word in IMMEDIATE_KEYWORDS):
             return 0
 
         # Default duration
         return self.default_duration
 
-    def _extract_pattern(self, text: str) -> Optional[str]:
+    def _extract_pattern(
+        self, text: str, found: Optional[FrozenSet[str]] = None
+    ) -> Optional[str]:
         """
         Extract motion pattern from text.
         
         Args:
             text: Lowercase step text
+            found: Keywords present in text (see ``_find_keywords``), if precomputed
             
         Returns:
             Motion pattern name or None
         """
-        if "circular" in text or "circle" in text or "round" in text:
-            return "circular"
-        elif "back and forth" in text or "backward and forward" in text or "side to side" in text:
-            return "back_and_forth"
-        elif "up and down" in text or "vertical" in text:
-            return "vertical"
-        elif "horizontal" in text or "left to right" in text:
-            return "horizontal"
-        elif "gentle" in text or "light" in text:
-            return "gentle"
+        if found is None:
+            found = _find_keywords(text)
+        for pattern, keywords in PATTERN_KEYWORDS.items():
+            if any(keyword in found for keyword in keywords):
+                return pattern
 
         return None
 
@@ -360,39 +479,122 @@ class ActionExtractor:
         return min(1.0, max(0.0, confidence))
 
 
-def extract_actions_from_document(document: Dict) -> List[Dict]:
+@functools.cache
+def _default_extractor() -> ActionExtractor:
+    """Shared ActionExtractor with default settings, built on first use."""
+    return ActionExtractor()
+
+
+def _step_texts(steps: Iterable) -> Iterator[str]:
+    """Yield step texts from a document's steps (string list or dict list format)."""
+    for step in steps:
+        if isinstance(step, str):
+            yield step
+        elif isinstance(step, dict):
+            yield step.get("step", "")
+
+
+def _document_context(document: Dict) -> Dict[str, str]:
+    """Document fields added to each action extracted from it."""
+    return {
+        "document_url": document.get("url", ""),
+        "surface_type": document.get("surface_type", "unknown"),
+        "dirt_type": document.get("dirt_type", "unknown"),
+        "cleaning_method": document.get("cleaning_method", "unknown"),
+    }
+
+
+def extract_actions_from_document(
+    document: Dict, extractor: Optional[ActionExtractor] = None
+) -> List[Dict]:
     """
     Extract robot actions from a processed document.
     
     Args:
         document: Document dictionary with 'steps' field
+        extractor: ActionExtractor to use (a shared default one if None)
         
     Returns:
         List of structured action dictionaries
     """
-    extractor = ActionExtractor()
+    if extractor is None:
+        extractor = _default_extractor()
 
     steps = document.get("steps", [])
     if not steps:
-        logger.debug(f"No steps found in document: {document.get('url', 'unknown')}")
+        logger.debug("No steps found in document: %s", document.get("url", "unknown"))
         return []
 
-    # Handle both string list and dict list formats
-    step_texts = []
-    for step in steps:
-        if isinstance(step, str):
-            step_texts.append(step)
-        elif isinstance(step, dict):
-            step_texts.append(step.get("step", ""))
-
-    actions = extractor.extract_actions(step_texts)
+    actions = extractor.extract_actions(list(_step_texts(steps)))
 
     # Add document context to each action
+    context = _document_context(document)
     for action in actions:
-        action["document_url"] = document.get("url", "")
-        action["surface_type"] = document.get("surface_type", "unknown")
-        action["dirt_type"] = document.get("dirt_type", "unknown")
-        action["cleaning_method"] = document.get("cleaning_method", "unknown")
+        action.update(context)
 
     return actions
 
+
+def iter_actions_from_document(
+    document: Dict, extractor: Optional[ActionExtractor] = None
+) -> Iterator[Dict]:
+    """
+    Extract robot actions from a processed document lazily, without
+    building the full action list.
+    
+    Args:
+        document: Document dictionary with 'steps' field
+        extractor: ActionExtractor to use (a shared default one if None)
+        
+    Yields:
+        Structured action dictionaries with document context, in step order
+    """
+    if extractor is None:
+        extractor = _default_extractor()
+
+    steps = document.get("steps", [])
+    if not steps:
+        logger.debug("No steps found in document: %s", document.get("url", "unknown"))
+        return
+
+    context = _document_context(document)
+    for action in extractor.iter_actions(_step_texts(steps)):
+        action.update(context)
+        yield action
+
+
+def extract_actions_from_documents(
+    documents: List[Dict], n_workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Extract robot actions from many processed documents.
+    
+    Args:
+        documents: Document dictionaries with 'steps' fields
+        n_workers: Worker processes to shard documents across (defaults to
+            the CPU count; 1 extracts in this process)
+        
+    Returns:
+        List of structured action dictionaries, in document order
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    actions: List[Dict] = []
+    if n_workers <= 1 or len(documents) <= 1:
+        for document in documents:
+            actions.extend(extract_actions_from_document(document))
+        return actions
+
+    # A few chunks per worker balances load while amortizing IPC; each
+    # worker builds its default extractor once, up front
+    chunk_size = max(1, len(documents) // (n_workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_default_extractor,
+    ) as pool:
+        for document_actions in pool.map(
+            extract_actions_from_document, documents, chunksize=chunk_size
+        ):
+            actions.extend(document_actions)
+    return actions
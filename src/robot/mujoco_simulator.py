@@ -5,8 +5,11 @@ Simulates cleaning actions in a physics engine to validate motions,
 check force/pressure, detect contact, and generate trajectories.
 """
 
+import functools
 import logging
+import os
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Any
 import numpy as np
 
@@ -26,6 +29,99 @@ except (ImportError, ModuleNotFoundError):
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_mjmodel(path_str: str) -> "mujoco.MjModel":
+    """Parse a model file once per process; the MjModel is shared read-only."""
+    return mujoco.MjModel.from_xml_path(path_str)
+
+
+@functools.lru_cache(maxsize=1)
+def _minimal_mjmodel() -> "mujoco.MjModel":
+    """Compile the fallback test model once per process; shared read-only."""
+    return mujoco.MjModel.from_xml_string(_MINIMAL_XML)
+
+
+# Minimal 3-DOF arm with a cleaning tool and a surface, used when a model
+# file is not available
+_MINIMAL_XML = """
+<mujoco>
+    <option timestep="0.002" gravity="0 0 -9.81"/>
+
+    <asset>
+        <!-- Materials for better visibility -->
+        <material name="robot_base" rgba="0.4 0.4 0.4 1"/>
+        <material name="link1_mat" rgba="0.9 0.2 0.2 1"/>
+        <material name="link2_mat" rgba="0.2 0.9 0.2 1"/>
+        <material name="link3_mat" rgba="0.2 0.2 0.9 1"/>
+        <material name="tool_mat" rgba="0.8 0.6 0.2 1"/>
+        <material name="surface_mat" rgba="0.7 0.7 0.9 1"/>
+    </asset>
+
+    <worldbody>
+        <!-- Lighting -->
+        <light pos="0 0 4" dir="0 0 -1"/>
+        <light pos="2 2 3" dir="-1 -1 -1"/>
+
+        <!-- Ground plane -->
+        <geom name="floor" type="plane" size="2 2 0.1" rgba="0.9 0.9 0.9 1"/>
+
+        <!-- Cleaning surface (table/counter) -->
+        <body name="cleaning_surface" pos="0.4 0 0.15">
+            <geom name="surface" type="box" size="0.3 0.3 0.02" 
+                  material="surface_mat" contype="1" conaffinity="1"/>
+        </body>
+
+        <!-- Robot base (fixed to ground) -->
+        <body name="base" pos="0 0 0.05">
+            <geom name="base_geom" type="cylinder" size="0.08 0.1" 
+                  material="robot_base" rgba="0.4 0.4 0.4 1"/>
+
+            <!-- Link 1: Rotating base (red) -->
+            <body name="link1" pos="0 0 0.15">
+                <joint name="joint1" type="hinge" axis="0 0 1" 
+                       range="-180 180" damping="0.1"/>
+                <geom name="link1_geom" type="cylinder" size="0.04 0.12" 
+                      material="link1_mat" rgba="0.9 0.2 0.2 1"/>
+
+                <!-- Link 2: Shoulder (green) -->
+                <body name="link2" pos="0 0 0.2">
+                    <joint name="joint2" type="hinge" axis="0 1 0" 
+                           range="-90 90" damping="0.1"/>
+                    <geom name="link2_geom" type="cylinder" size="0.035 0.15" 
+                          material="link2_mat" rgba="0.2 0.9 0.2 1"/>
+
+                    <!-- Link 3: Elbow (blue) -->
+                    <body name="link3" pos="0 0 0.25">
+                        <joint name="joint3" type="hinge" axis="0 1 0" 
+                               range="-90 90" damping="0.1"/>
+                        <geom name="link3_geom" type="cylinder" size="0.03 0.12" 
+                              material="link3_mat" rgba="0.2 0.2 0.9 1"/>
+
+                        <!-- End effector with cleaning tool -->
+                        <body name="tool" pos="0 0 0.18">
+                            <!-- Tool handle -->
+                            <geom name="tool_handle" type="box" size="0.02 0.02 0.05" 
+                                  material="tool_mat" rgba="0.8 0.6 0.2 1"/>
+                            <!-- Cleaning sponge/brush head -->
+                            <geom name="sponge" type="box" size="0.04 0.04 0.02" 
+                                  pos="0 0 -0.07" material="tool_mat" 
+                                  rgba="0.9 0.7 0.3 1" contype="1" conaffinity="1"/>
+                        </body>
+                    </body>
+                </body>
+            </body>
+        </body>
+    </worldbody>
+
+    <actuator>
+        <motor name="motor1" joint="joint1" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
+        <motor name="motor2" joint="joint2" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
+        <motor name="motor3" joint="joint3" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
+    </actuator>
+</mujoco>
+"""
+
+
 # Robot model configurations
 ROBOT_MODELS = {
     "franka_panda": {
@@ -54,6 +150,30 @@ ROBOT_MODELS = {
     },
 }
 
+# Actions that can grasp or release the bottle
+_ATTACH_ACTIONS = frozenset({"pick", "grasp", "place", "put"})
+_GRASP_ACTIONS = frozenset({"pick", "grasp"})
+
+# Squared (finger midpoint, each finger) distance thresholds for attaching the bottle.
+# CRITICAL: For pick/grasp, use strict threshold - bottle must be between fingers.
+# Bottle must be within 8cm of finger midpoint AND within 10cm of each finger
+# (slightly relaxed from 6cm/8cm to allow attachment when gripper is close enough).
+# For place: very lenient (25cm/30cm) to catch attachments missed during pick.
+_ATTACH_THRESHOLDS2 = {
+    "pick": (0.08 ** 2, 0.10 ** 2),
+    "grasp": (0.08 ** 2, 0.10 ** 2),
+    "place": (0.25 ** 2, 0.30 ** 2),
+    "put": (0.25 ** 2, 0.30 ** 2),
+}
+
+# Maps [static finger, moving finger, bottle] positions to the bottle's offsets
+# from the static finger, the moving finger and the finger midpoint
+_ATTACH_DIFF_WEIGHTS = np.array([
+    [1.0, 0.0, -1.0],
+    [0.0, 1.0, -1.0],
+    [0.5, 0.5, -1.0],
+])
+
 # Action type to motion parameters mapping
 ACTION_MOTION_PARAMS = {
     "apply": {
@@ -202,19 +322,25 @@ class MuJoCoSimulator:
 
         # Pick-and-place: lightweight "attach" state so a grasped free object follows the gripper.
         # This avoids the bottle being pushed away during approach and makes place deterministic.
+        self._has_attachment = False
         self._attached_body_id: Optional[int] = None
         self._attached_joint_id: Optional[int] = None
         self._attached_qposadr: Optional[int] = None
         self._attached_dofadr: Optional[int] = None
-        self._attached_rel_pos: Optional[np.ndarray] = None  # object position in EE frame
-        self._attached_rel_quat: Optional[np.ndarray] = None  # object orientation in EE frame
+        # Object pose in EE frame, kept contiguous: position [:3], orientation [3:]
+        self._attached_pose = np.zeros(7)
+        self._attached_rel_pos = self._attached_pose[:3]
+        self._attached_rel_quat = self._attached_pose[3:]
+        # Scratch buffers for the per-step held-pose update
+        self._scratch_pos = np.empty(3)
+        self._scratch_quat = np.empty(4)
 
         self._load_model()
 
         # Find end-effector body ID
         if self.model:
             try:
-                self.ee_body_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_moving_finger")
+                self.ee_body_id = self._body_ids.get("gripper_moving_finger", -1)
                 if self.ee_body_id < 0:
                     # Fallback: try to find any gripper body
                     for i in range(self.model.nbody):
@@ -279,29 +405,23 @@ class MuJoCoSimulator:
     @staticmethod
     def _quat_conjugate(q: np.ndarray) -> np.ndarray:
         """Quaternion conjugate, q = [w, x, y, z]."""
-        return np.array([q[0], -q[1], -q[2], -q[3]], dtype=float)
+        qc = np.empty(4)
+        mujoco.mju_negQuat(qc, np.asarray(q, dtype=float))
+        return qc
 
     @staticmethod
     def _quat_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
         """Hamilton product, q = q1 * q2, with q = [w, x, y, z]."""
-        w1, x1, y1, z1 = q1
-        w2, x2, y2, z2 = q2
-        return np.array(
-            [
-                w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
-                w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
-                w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
-                w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
-            ],
-            dtype=float,
-        )
+        q = np.empty(4)
+        mujoco.mju_mulQuat(q, np.asarray(q1, dtype=float), np.asarray(q2, dtype=float))
+        return q
 
     @staticmethod
     def _quat_normalize(q: np.ndarray) -> np.ndarray:
-        n = float(np.linalg.norm(q))
-        if n < 1e-12:
-            return np.array([1.0, 0.0, 0.0, 0.0], dtype=float)
-        return q / n
+        """Unit quaternion in the direction of q ([1, 0, 0, 0] if q is ~zero)."""
+        qn = np.array(q, dtype=float)
+        mujoco.mju_normalize4(qn)
+        return qn
 
     @classmethod
     def _quat_inverse(cls, q: np.ndarray) -> np.ndarray:
@@ -311,34 +431,18 @@ class MuJoCoSimulator:
     @classmethod
     def _quat_rotate(cls, q: np.ndarray, v: np.ndarray) -> np.ndarray:
         """Rotate 3D vector v by quaternion q (q assumed unit-ish)."""
-        qn = cls._quat_normalize(q)
-        vq = np.array([0.0, v[0], v[1], v[2]], dtype=float)
-        rq = cls._quat_multiply(cls._quat_multiply(qn, vq), cls._quat_conjugate(qn))
-        return rq[1:]
+        qn = cls._quat_normalize(np.asarray(q, dtype=float))
+        res = np.empty(3)
+        mujoco.mju_rotVecQuat(res, np.asarray(v, dtype=float), qn)
+        return res
 
     def _clear_attachment(self) -> None:
+        self._has_attachment = False
         self._attached_body_id = None
-        self._attached_joint_id = None
-        self._attached_qposadr = None
-        self._attached_dofadr = None
-        self._attached_rel_pos = None
-        self._attached_rel_quat = None
 
     def _get_freejoint_for_body(self, body_id: int) -> Optional[Dict[str, int]]:
         """Return joint/qpos/qvel addresses for a free joint on a body (if present)."""
-        try:
-            for j in range(self.model.njnt):
-                if int(self.model.jnt_bodyid[j]) != int(body_id):
-                    continue
-                if int(self.model.jnt_type[j]) == int(mujoco.mjtJoint.mjJNT_FREE):
-                    return {
-                        "joint_id": int(j),
-                        "qposadr": int(self.model.jnt_qposadr[j]),
-                        "dofadr": int(self.model.jnt_dofadr[j]),
-                    }
-        except Exception:
-            return None
-        return None
+        return self._freejoint_cache.get(int(body_id))
 
     def _attach_body_to_ee(self, body_id: int) -> bool:
         """Attach a free body to the end-effector by recording EE-relative pose."""
@@ -348,11 +452,12 @@ class MuJoCoSimulator:
         if not freeinfo:
             return False
 
-        ee_pos = self.data.xpos[self.ee_body_id].copy()
-        ee_quat = self.data.xquat[self.ee_body_id].copy()
-        obj_pos = self.data.xpos[body_id].copy()
+        # Read-only views: every quaternion helper below writes to fresh arrays
+        ee_pos = self.data.xpos[self.ee_body_id]
+        ee_quat = self.data.xquat[self.ee_body_id]
+        obj_pos = self.data.xpos[body_id]
         obj_quat = (
-            self.data.xquat[body_id].copy()
+            self.data.xquat[body_id]
             if body_id < len(self.data.xquat)
             else np.array([1, 0, 0, 0], dtype=float)
         )
@@ -366,131 +471,99 @@ class MuJoCoSimulator:
         self._attached_joint_id = int(freeinfo["joint_id"])
         self._attached_qposadr = int(freeinfo["qposadr"])
         self._attached_dofadr = int(freeinfo["dofadr"])
-        self._attached_rel_pos = rel_pos
-        self._attached_rel_quat = rel_quat
+        np.copyto(self._attached_rel_pos, rel_pos)
+        np.copyto(self._attached_rel_quat, rel_quat)
+        self._has_attachment = True
         return True
 
     def _update_attached_body_pose(self) -> None:
         """If attached, overwrite object's free-joint state to follow EE (then forward)."""
-        if (
-            self._attached_body_id is None
-            or self._attached_qposadr is None
-            or self._attached_dofadr is None
-            or self._attached_rel_pos is None
-            or self._attached_rel_quat is None
-            or self.ee_body_id is None
-            or self.ee_body_id < 0
-        ):
+        if not self._has_attachment or self.ee_body_id is None or self.ee_body_id < 0:
             return
 
-        ee_pos = self.data.xpos[self.ee_body_id].copy()
-        ee_quat = self.data.xquat[self.ee_body_id].copy()
-        new_pos = ee_pos + self._quat_rotate(ee_quat, self._attached_rel_pos)
-        new_quat = self._quat_multiply(ee_quat, self._attached_rel_quat)
-        new_quat = self._quat_normalize(new_quat)
-
+        ee_pos = self.data.xpos[self.ee_body_id]
+        ee_quat = self.data.xquat[self.ee_body_id]
         qadr = self._attached_qposadr
-        self.data.qpos[qadr : qadr + 3] = new_pos
-        self.data.qpos[qadr + 3 : qadr + 7] = new_quat
+
+        # Write the held pose straight into the free joint's qpos through
+        # MuJoCo's quaternion helpers, using preallocated scratch buffers.
+        np.copyto(self._scratch_quat, ee_quat)
+        mujoco.mju_normalize4(self._scratch_quat)
+        mujoco.mju_rotVecQuat(self._scratch_pos, self._attached_rel_pos, self._scratch_quat)
+        np.add(ee_pos, self._scratch_pos, out=self.data.qpos[qadr : qadr + 3])
+        new_quat = self.data.qpos[qadr + 3 : qadr + 7]
+        mujoco.mju_mulQuat(new_quat, ee_quat, self._attached_rel_quat)
+        mujoco.mju_normalize4(new_quat)
 
         # Kill object velocity while held to prevent energy buildup.
         dadr = self._attached_dofadr
         if dadr >= 0 and dadr + 6 <= len(self.data.qvel):
             self.data.qvel[dadr : dadr + 6] = 0.0
 
-        mujoco.mj_forward(self.model, self.data)
+        # Refresh body poses and contacts for this step's readouts; the next
+        # mj_step recomputes dynamics, so a full mj_forward is not needed.
+        mujoco.mj_kinematics(self.model, self.data)
+        mujoco.mj_collision(self.model, self.data)
 
     def _maybe_attach_or_detach_bottle(self, action_type: str) -> None:
         """Attach bottle when gripper closes near it; detach when gripper opens."""
-        if action_type not in ["pick", "grasp", "place", "put"]:
-            return
-        if len(self.data.qpos) < 6:
+        if not self._can_attach or action_type not in _ATTACH_ACTIONS:
             return
 
-        gripper_angle = float(self.data.qpos[5])
-        gripper_closed = gripper_angle < -0.7
-        gripper_open = gripper_angle > -0.35
+        gripper_angle = self.data.qpos.item(5)
 
-        # Detach if we were holding and the gripper opens.
-        if self._attached_body_id is not None and gripper_open:
-            self._clear_attachment()
-            return
-
-        # Keep updating pose while attached.
-        if self._attached_body_id is not None:
-            self._update_attached_body_pose()
+        if self._has_attachment:
+            # Detach if we were holding and the gripper opens; otherwise keep
+            # updating the held pose.
+            if gripper_angle > -0.35:
+                self._clear_attachment()
+            else:
+                self._update_attached_body_pose()
             return
 
         # Try to attach if gripper is closed (works for both pick and place actions)
+        gripper_closed = gripper_angle < -0.7
         if not gripper_closed:
             return
 
-        try:
-            bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
-            if bottle_id < 0:
-                return
-
-            # Get gripper finger positions for accurate distance check
-            static_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_static_finger")
-            moving_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_moving_finger")
-            if static_id < 0 or moving_id < 0:
-                return
-
-            bottle_pos = self.data.xpos[bottle_id].copy()
-            static_pos = self.data.xpos[static_id].copy()
-            moving_pos = self.data.xpos[moving_id].copy()
-            finger_midpoint = (static_pos + moving_pos) / 2.0
-
-            # Use distance to finger midpoint (more accurate than end-effector body)
-            distance_to_gripper = float(np.linalg.norm(bottle_pos - finger_midpoint))
-            dist_to_static = float(np.linalg.norm(bottle_pos - static_pos))
-            dist_to_moving = float(np.linalg.norm(bottle_pos - moving_pos))
-
-            # CRITICAL: For pick/grasp, use strict threshold - bottle must be between fingers
-            # This ensures proper grasp before attachment
-            # For place: much more lenient to catch cases where attachment was missed during pick
-            if action_type in ["pick", "grasp"]:
-                # Bottle must be within 8cm of finger midpoint AND within 10cm of each finger
-                # Slightly relaxed from 6cm/8cm to allow attachment when gripper is close enough
-                max_midpoint_dist = 0.08  # 8cm - strict but achievable
-                max_finger_dist = 0.10    # 10cm - ensures bottle is between fingers
-            else:
-                # For place: very lenient (25cm) to catch missed attachments from pick
-                # If bottle wasn't attached during pick, we need to catch it here
-                max_midpoint_dist = 0.25  # 25cm - very lenient for recovery
-                max_finger_dist = 0.30    # 30cm - allows attachment even if not perfectly positioned
+        # Squared distances from the bottle to the static finger, the moving
+        # finger and the finger midpoint (more accurate than end-effector body),
+        # from one gather of the three body positions
+        diffs = _ATTACH_DIFF_WEIGHTS @ self.data.xpos[self._attach_point_ids]
+        d2_static, d2_moving, d2_midpoint = np.einsum("ij,ij->i", diffs, diffs)
+
+        max_midpoint_d2, max_finger_d2 = _ATTACH_THRESHOLDS2[action_type]
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Log distance for debugging (only occasionally to avoid spam)
+        if debug and action_type in _GRASP_ACTIONS and d2_midpoint < 0.15 * 0.15:
+            logger.debug(
+                "  [%s] Attachment check: midpoint=%.3fm (threshold=%.3fm), "
+                "static=%.3fm, moving=%.3fm, gripper_closed=%s",
+                action_type.upper(), np.sqrt(d2_midpoint), np.sqrt(max_midpoint_d2),
+                np.sqrt(d2_static), np.sqrt(d2_moving), gripper_closed,
+            )
 
-            # Log distance for debugging (only occasionally to avoid spam)
-            if action_type in ["pick", "grasp"] and distance_to_gripper < 0.15:
+        if (d2_midpoint < max_midpoint_d2 and
+            d2_static < max_finger_d2 and
+            d2_moving < max_finger_d2):
+            attached = self._attach_body_to_ee(self._bottle_id)
+            if attached:
+                logger.info(
+                    "  [%s] ✓ Attached bottle to gripper "
+                    "(midpoint: %.3fm, static: %.3fm, moving: %.3fm)",
+                    action_type.upper(), np.sqrt(d2_midpoint), np.sqrt(d2_static), np.sqrt(d2_moving),
+                )
+                # Immediately snap object to the held pose this step.
+                self._update_attached_body_pose()
+        elif debug and action_type not in _GRASP_ACTIONS:
+            # Log why attachment failed during place (for debugging)
+            if d2_midpoint >= max_midpoint_d2:
                 logger.debug(
-                    f"  [{action_type.upper()}] Attachment check: "
-                    f"midpoint={distance_to_gripper:.3f}m (threshold={max_midpoint_dist:.3f}m), "
-                    f"static={dist_to_static:.3f}m, moving={dist_to_moving:.3f}m, "
-                    f"gripper_closed={gripper_closed}"
+                    "  [%s] Attachment failed: distance %.3fm > threshold %.3fm",
+                    action_type.upper(), np.sqrt(d2_midpoint), np.sqrt(max_midpoint_d2),
                 )
 
-            if (distance_to_gripper < max_midpoint_dist and
-                dist_to_static < max_finger_dist and
-                dist_to_moving < max_finger_dist):
-                attached = self._attach_body_to_ee(bottle_id)
-                if attached:
-                    logger.info(
-                        f"  [{action_type.upper()}] ✓ Attached bottle to gripper "
-                        f"(midpoint: {distance_to_gripper:.3f}m, static: {dist_to_static:.3f}m, moving: {dist_to_moving:.3f}m)"
-                    )
-                    # Immediately snap object to the held pose this step.
-                    self._update_attached_body_pose()
-            elif action_type in ["place", "put"] and gripper_closed:
-                # Log why attachment failed during place (for debugging)
-                if distance_to_gripper >= max_midpoint_dist:
-                    logger.debug(
-                        f"  [{action_type.upper()}] Attachment failed: "
-                        f"distance {distance_to_gripper:.3f}m > threshold {max_midpoint_dist:.3f}m"
-                    )
-        except Exception as e:
-            logger.debug(f"  Error in attachment check: {e}")
-            return
-
     def _load_model(self) -> None:
         """Load MuJoCo model from XML file."""
         if not self.model_path.exists():
@@ -501,7 +574,7 @@ class MuJoCoSimulator:
             self._create_minimal_model()
         else:
             try:
-                self.model = mujoco.MjModel.from_xml_path(str(self.model_path))
+                self.model = _load_mjmodel(str(self.model_path))
                 self.data = mujoco.MjData(self.model)
                 logger.info(f"Loaded model from: {self.model_path}")
                 logger.info(f"  Model DOF: {self.model.nv}, Actuators: {self.model.nu}")
@@ -534,91 +607,47 @@ class MuJoCoSimulator:
                 logger.info("Creating minimal test model instead...")
                 self._create_minimal_model()
 
+        self._cache_model_lookups()
+
+    def _cache_model_lookups(self) -> None:
+        """Resolve body IDs and free-joint addresses used every simulation step."""
+        self._body_ids: Dict[str, int] = {}
+        for i in range(self.model.nbody):
+            name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_BODY, i)
+            if name:
+                self._body_ids[name] = i
+
+        self._bottle_id = self._body_ids.get("cleaning_bottle", -1)
+        self._static_finger_id = self._body_ids.get("gripper_static_finger", -1)
+        self._moving_finger_id = self._body_ids.get("gripper_moving_finger", -1)
+        self._attach_point_ids = np.array([self._static_finger_id, self._moving_finger_id, self._bottle_id])
+
+        # First free joint of each body, in joint order
+        self._freejoint_cache: Dict[int, Dict[str, int]] = {}
+        free_joints = np.flatnonzero(self.model.jnt_type == mujoco.mjtJoint.mjJNT_FREE)
+        for j in free_joints:
+            self._freejoint_cache.setdefault(int(self.model.jnt_bodyid[j]), {
+                "joint_id": int(j),
+                "qposadr": int(self.model.jnt_qposadr[j]),
+                "dofadr": int(self.model.jnt_dofadr[j]),
+            })
+
+        # Bottle attachment needs both fingers, the bottle and a gripper joint;
+        # without them the per-step check is skipped entirely
+        self._can_attach = (
+            self.model.nq >= 6
+            and self._bottle_id >= 0
+            and self._static_finger_id >= 0
+            and self._moving_finger_id >= 0
+        )
+
     def _create_minimal_model(self) -> None:
         """
         Create a minimal MuJoCo model for testing when model file is not available.
         
         This creates a simple 3-DOF arm with a cleaning tool and a surface to clean.
         """
-        xml_string = """
-        <mujoco>
-            <option timestep="0.002" gravity="0 0 -9.81"/>
-            
-            <asset>
-                <!-- Materials for better visibility -->
-                <material name="robot_base" rgba="0.4 0.4 0.4 1"/>
-                <material name="link1_mat" rgba="0.9 0.2 0.2 1"/>
-                <material name="link2_mat" rgba="0.2 0.9 0.2 1"/>
-                <material name="link3_mat" rgba="0.2 0.2 0.9 1"/>
-                <material name="tool_mat" rgba="0.8 0.6 0.2 1"/>
-                <material name="surface_mat" rgba="0.7 0.7 0.9 1"/>
-            </asset>
-            
-            <worldbody>
-                <!-- Lighting -->
-                <light pos="0 0 4" dir="0 0 -1"/>
-                <light pos="2 2 3" dir="-1 -1 -1"/>
-                
-                <!-- Ground plane -->
-                <geom name="floor" type="plane" size="2 2 0.1" rgba="0.9 0.9 0.9 1"/>
-                
-                <!-- Cleaning surface (table/counter) -->
-                <body name="cleaning_surface" pos="0.4 0 0.15">
-                    <geom name="surface" type="box" size="0.3 0.3 0.02" 
-                          material="surface_mat" contype="1" conaffinity="1"/>
-                </body>
-                
-                <!-- Robot base (fixed to ground) -->
-                <body name="base" pos="0 0 0.05">
-                    <geom name="base_geom" type="cylinder" size="0.08 0.1" 
-                          material="robot_base" rgba="0.4 0.4 0.4 1"/>
-                    
-                    <!-- Link 1: Rotating base (red) -->
-                    <body name="link1" pos="0 0 0.15">
-                        <joint name="joint1" type="hinge" axis="0 0 1" 
-                               range="-180 180" damping="0.1"/>
-                        <geom name="link1_geom" type="cylinder" size="0.04 0.12" 
-                              material="link1_mat" rgba="0.9 0.2 0.2 1"/>
-                        
-                        <!-- Link 2: Shoulder (green) -->
-                        <body name="link2" pos="0 0 0.2">
-                            <joint name="joint2" type="hinge" axis="0 1 0" 
-                                   range="-90 90" damping="0.1"/>
-                            <geom name="link2_geom" type="cylinder" size="0.035 0.15" 
-                                  material="link2_mat" rgba="0.2 0.9 0.2 1"/>
-                            
-                            <!-- Link 3: Elbow (blue) -->
-                            <body name="link3" pos="0 0 0.25">
-                                <joint name="joint3" type="hinge" axis="0 1 0" 
-                                       range="-90 90" damping="0.1"/>
-                                <geom name="link3_geom" type="cylinder" size="0.03 0.12" 
-                                      material="link3_mat" rgba="0.2 0.2 0.9 1"/>
-                                
-                                <!-- End effector with cleaning tool -->
-                                <body name="tool" pos="0 0 0.18">
-                                    <!-- Tool handle -->
-                                    <geom name="tool_handle" type="box" size="0.02 0.02 0.05" 
-                                          material="tool_mat" rgba="0.8 0.6 0.2 1"/>
-                                    <!-- Cleaning sponge/brush head -->
-                                    <geom name="sponge" type="box" size="0.04 0.04 0.02" 
-                                          pos="0 0 -0.07" material="tool_mat" 
-                                          rgba="0.9 0.7 0.3 1" contype="1" conaffinity="1"/>
-                                </body>
-                            </body>
-                        </body>
-                    </body>
-                </body>
-            </worldbody>
-            
-            <actuator>
-                <motor name="motor1" joint="joint1" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
-                <motor name="motor2" joint="joint2" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
-                <motor name="motor3" joint="joint3" gear="100" ctrllimited="true" ctrlrange="-50 50"/>
-            </actuator>
-        </mujoco>
-        """
-
-        self.model = mujoco.MjModel.from_xml_string(xml_string)
+        self.model = _minimal_mjmodel()
         self.data = mujoco.MjData(self.model)
         logger.info("Created minimal 3-DOF arm model with cleaning surface and tool")
 
@@ -647,6 +676,9 @@ class MuJoCoSimulator:
         if not self.model or not self.data:
             raise RuntimeError("Model not loaded. Call _load_model() first.")
 
+        # Resolved once at model load; reused throughout this action
+        bottle_id = self._bottle_id
+
         action_type = action.get("action_type", "apply")
         duration = action.get("duration", 30)
         force = action.get("force", 5.0)
@@ -668,7 +700,6 @@ class MuJoCoSimulator:
                     # Get actual bottle position from current simulation state
                     # NOTE: This is called AFTER reset, so we get the reset position
                     try:
-                        bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                         if bottle_id >= 0:
                             # Use current bottle position from simulation (after reset and forward kinematics)
                             target_position = self.data.xpos[bottle_id].copy()
@@ -702,7 +733,6 @@ class MuJoCoSimulator:
                                 f"  [PLACE] Using end-effector position as reference: [{reference_pos[0]:.3f}, {reference_pos[1]:.3f}, {reference_pos[2]:.3f}]")
                         else:
                             # Fallback: try to get bottle position
-                            bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                             if bottle_id >= 0:
                                 reference_pos = self.data.xpos[bottle_id].copy()
                                 logger.info(
@@ -733,7 +763,6 @@ class MuJoCoSimulator:
                     # Target bottle position for applying (on table surface)
                     # CHANGE: Get actual bottle position for apply actions too
                     try:
-                        bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                         if bottle_id >= 0:
                             target_position = self.data.xpos[bottle_id].copy()
                             target_position[2] += 0.03  # Slightly above bottle
@@ -761,14 +790,13 @@ class MuJoCoSimulator:
             mujoco.mj_forward(self.model, self.data)
 
             # Check if bottle is already attached from pick action
-            if self._attached_body_id is not None:
+            if self._has_attachment:
                 logger.info(f"  [PLACE] ✓ Bottle already attached from pick action (body_id={self._attached_body_id})")
             else:
                 logger.warning("  [PLACE] ⚠️  Bottle NOT attached from pick - will try to attach during place action")
 
             # Log current bottle position to verify it's being held
             try:
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     bottle_pos = self.data.xpos[bottle_id].copy()
                     logger.info(
@@ -782,7 +810,7 @@ class MuJoCoSimulator:
                             f"  [PLACE] EE position: [{ee_pos[0]:.3f}, {ee_pos[1]:.3f}, {ee_pos[2]:.3f}], dist to bottle: {dist:.3f}m")
 
                         # If bottle is far and not attached, warn
-                        if dist > 0.20 and self._attached_body_id is None:
+                        if dist > 0.20 and not self._has_attachment:
                             logger.warning(
                                 f"  [PLACE] ⚠️  Bottle is {dist:.3f}m away and not attached - attachment may fail!")
             except Exception as e:
@@ -797,7 +825,6 @@ class MuJoCoSimulator:
         # This allows us to configure bottle position in the XML model
         if action_type == "pick" or action_type == "grasp":
             try:
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     current_bottle_pos = self.data.xpos[bottle_id].copy()
                     logger.info(
@@ -814,7 +841,6 @@ class MuJoCoSimulator:
             # For place actions, bottle should be in the gripper from the previous pick action
             try:
                 # Get bottle's current position (should be near EE if pick was successful)
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     bottle_pos = self.data.xpos[bottle_id].copy()
                     logger.info(
@@ -840,7 +866,6 @@ class MuJoCoSimulator:
         if action_type == "pick" or action_type == "grasp":
             # Re-get bottle position after reset
             try:
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     # Get actual bottle position after reset
                     target_position = self.data.xpos[bottle_id].copy()
@@ -864,7 +889,6 @@ class MuJoCoSimulator:
                 if action_type == "pick" or action_type == "grasp":
                     # Get actual bottle position from current simulation state (after reset)
                     try:
-                        bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                         if bottle_id >= 0:
                             target_position = self.data.xpos[bottle_id].copy()
                             # Verify we got a valid position (not [0,0,0])
@@ -892,7 +916,6 @@ class MuJoCoSimulator:
                     target_position = np.array([0.15, -0.08, 0.17])
                 elif action_type == "apply":
                     try:
-                        bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                         if bottle_id >= 0:
                             target_position = self.data.xpos[bottle_id].copy()
                             target_position[2] += 0.03
@@ -908,7 +931,6 @@ class MuJoCoSimulator:
         # CHANGE: Log initial state for pick/place actions
         if action_type in ["pick", "grasp", "place", "put"]:
             try:
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     bottle_pos = self.data.xpos[bottle_id].copy()
                     ee_pos = self.data.xpos[self.ee_body_id].copy(
@@ -1018,9 +1040,7 @@ class MuJoCoSimulator:
         )
 
         # Simulate motion
-        forces = []
         contacts = []
-        joint_positions = []
 
         # CHANGE: Track gripper contact and object positions for pick/place actions
         gripper_contact_history = []  # Track gripper contact over time
@@ -1028,6 +1048,10 @@ class MuJoCoSimulator:
 
         n_steps = int(duration / self.timestep)
 
+        # Per-step joint positions and contact forces, written in place
+        joint_positions = np.empty((n_steps, self.model.nq))
+        forces = np.empty(n_steps)
+
         # CHANGE: Calculate phase boundaries for pick actions
         if action_type in ["pick", "grasp"]:
             # Must match `_generate_trajectory` pick/grasp phases.
@@ -1048,6 +1072,17 @@ class MuJoCoSimulator:
         # For viewer, update more frequently for smoother visualization
         viewer_update_interval = max(1, int(0.01 / self.timestep))  # Update every ~10ms
 
+        # CHANGE: Enhanced logging for pick/place actions
+        pick_place = action_type in _ATTACH_ACTIONS
+        if pick_place:
+            # Log every 0.05 seconds (more frequent for pick/place)
+            log_interval = int(0.05 / self.timestep)
+        else:
+            # Log every 0.1 seconds for other actions
+            log_interval = int(0.1 / self.timestep)
+        has_gripper_joint = self.model.nq >= 6
+        has_ee_body = self.ee_body_id is not None and self.ee_body_id < len(self.data.xpos)
+
         for step in range(n_steps):
             # Get desired joint positions from trajectory
             if step < len(trajectory):
@@ -1119,33 +1154,33 @@ class MuJoCoSimulator:
                     time.sleep(sleep_time)
 
             # Record data
-            joint_positions.append(self.data.qpos.copy())
+            joint_positions[step] = self.data.qpos
 
             # Get contact forces
             contact_force = self._get_contact_force()
-            forces.append(contact_force)
+            forces[step] = contact_force
 
-            # Detailed logging: track positions and movements
+            # Detailed logging: track positions and movements. Poses are only
+            # snapshotted on steps that record a contact or emit a log line.
             current_time = step * self.timestep
-            ee_pos = self.data.xpos[self.ee_body_id].copy() if self.ee_body_id is not None and self.ee_body_id < len(
-                self.data.xpos) else np.array([0, 0, 0])
-            ee_quat = self.data.xquat[-1].copy() if len(self.data.xquat) > 0 else np.array([1, 0, 0, 0])
+            log_step = step % log_interval == 0
+            in_contact = contact_force > 0.1  # Threshold for contact detection
+            if in_contact or log_step:
+                ee_pos = self.data.xpos[self.ee_body_id].copy() if has_ee_body else np.array([0, 0, 0])
 
-            # Track object positions (bottle, stains, etc.)
-            object_positions = {}
-            try:
+            # Detect contacts
+            if in_contact:
+                ee_quat = self.data.xquat[-1].copy() if len(self.data.xquat) > 0 else np.array([1, 0, 0, 0])
+
+                # Track object positions (bottle, stains, etc.)
+                object_positions = {}
                 # Get bottle position if it exists
-                bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                 if bottle_id >= 0:
                     object_positions["bottle"] = {
-                        "position": self.data.xpos[bottle_id].copy().tolist(),
-                        "quaternion": self.data.xquat[bottle_id].copy().tolist() if bottle_id < len(self.data.xquat) else [1, 0, 0, 0]
+                        "position": self.data.xpos[bottle_id].tolist(),
+                        "quaternion": self.data.xquat[bottle_id].tolist() if bottle_id < len(self.data.xquat) else [1, 0, 0, 0]
                     }
-            except Exception:
-                pass
 
-            # Detect contacts
-            if contact_force > 0.1:  # Threshold for contact detection
                 contacts.append({
                     "time": current_time,
                     "force": float(contact_force),
@@ -1153,60 +1188,47 @@ class MuJoCoSimulator:
                     "end_effector": {
                         "position": ee_pos.tolist(),
                         "quaternion": ee_quat.tolist(),
-                        "joint_positions": self.data.qpos.copy().tolist(),
+                        "joint_positions": self.data.qpos.tolist(),
                     },
                     "objects": object_positions,
                 })
 
             # Check gripper contact for pick/place actions
-            if action_type in ["pick", "grasp", "place", "put"]:
+            if pick_place:
                 gripper_contact = self._check_gripper_contact("cleaning_bottle")
+                gripper_value = self.data.qpos.item(5) if has_gripper_joint else 0.0
 
                 # CHANGE: Track gripper contact history
                 gripper_contact_history.append({
                     "time": current_time,
                     "contact": gripper_contact,
-                    "gripper_state": float(self.data.qpos[5]) if len(self.data.qpos) >= 6 else 0.0,
+                    "gripper_state": gripper_value,
                 })
 
                 # CHANGE: Track object position history
-                try:
-                    bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
-                    if bottle_id >= 0:
-                        bottle_pos = self.data.xpos[bottle_id].copy()
-                        object_position_history.append({
-                            "time": current_time,
-                            "position": bottle_pos.tolist(),
-                            "z": float(bottle_pos[2]),
-                        })
-                except Exception:
-                    pass
+                if bottle_id >= 0:
+                    bottle_xyz = self.data.xpos[bottle_id].tolist()
+                    object_position_history.append({
+                        "time": current_time,
+                        "position": bottle_xyz,
+                        "z": bottle_xyz[2],
+                    })
 
                 if gripper_contact and len(contacts) > 0:
                     # Update last contact with gripper contact info
                     contacts[-1]["gripper_contact"] = True
-                    contacts[-1]["gripper_state"] = float(self.data.qpos[5]) if len(self.data.qpos) >= 6 else 0.0
-
-            # CHANGE: Enhanced logging for pick/place actions
-            if action_type in ["pick", "grasp", "place", "put"]:
-                # Log every 0.05 seconds (more frequent for pick/place)
-                log_interval = int(0.05 / self.timestep)
-            else:
-                # Log every 0.1 seconds for other actions
-                log_interval = int(0.1 / self.timestep)
+                    contacts[-1]["gripper_state"] = gripper_value
 
-            if step % log_interval == 0:
+            if log_step:
                 gripper_state = "open" if (len(self.data.qpos) >= 6 and self.data.qpos[5] > -0.5) else "closed"
                 gripper_angle = self.data.qpos[5] if len(self.data.qpos) >= 6 else 0.0
 
-                if action_type in ["pick", "grasp", "place", "put"]:
-                    # Get bottle position and distance
+                if pick_place:
+                    # Get bottle position and distance (gripper_contact was checked above this step)
                     try:
-                        bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                         if bottle_id >= 0:
                             bottle_pos = self.data.xpos[bottle_id].copy()
                             distance_to_bottle = np.linalg.norm(ee_pos - bottle_pos)
-                            gripper_contact = self._check_gripper_contact("cleaning_bottle")
 
                             # Determine current phase for pick action
                             phase_info = ""
@@ -1242,8 +1264,6 @@ class MuJoCoSimulator:
                                 # Check if bottle is being pressed (high force, no contact, bottle moving down)
                                 bottle_velocity = 0.0
                                 try:
-                                    bottle_id = mujoco.mj_name2id(
-                                        self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
                                     if bottle_id >= 0 and bottle_id < len(self.data.qvel):
                                         # Get bottle velocity (free joint has 6 DOF: 3 linear + 3 angular)
                                         qvel_addr = self.model.jnt_dofadr[self.model.jnt_bodyid[bottle_id]]
@@ -1293,7 +1313,6 @@ class MuJoCoSimulator:
         # Final object positions
         final_object_positions = {}
         try:
-            bottle_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "cleaning_bottle")
             if bottle_id >= 0:
                 final_object_positions["bottle"] = {
                     "position": self.data.xpos[bottle_id].copy().tolist(),
@@ -1309,8 +1328,8 @@ class MuJoCoSimulator:
 
         result = {
             "success": validation["valid"],
-            "trajectory": [qpos.tolist() for qpos in joint_positions],
-            "forces": [float(f) for f in forces],
+            "trajectory": joint_positions.tolist(),
+            "forces": forces.tolist(),
             "contacts": contacts,
             "validation": validation,
             "action_type": action_type,
@@ -1340,7 +1359,7 @@ class MuJoCoSimulator:
         if action_type in ["pick", "grasp", "place", "put"]:
             logger.info(f"  [{action_type.upper()}] Simulation complete: {'SUCCESS' if validation['valid'] else 'FAILED'}")
             logger.info(f"  [{action_type.upper()}] Contacts detected: {len(contacts)}")
-            logger.info(f"  [{action_type.upper()}] Max force: {max(forces) if forces else 0:.2f}N")
+            logger.info(f"  [{action_type.upper()}] Max force: {validation['max_force']:.2f}N")
             logger.info(f"  [{action_type.upper()}] Validation: {validation['summary']}")
             logger.info(
                 f"  [{action_type.upper()}] End-effector final: [{final_ee_pos[0]:.3f}, {final_ee_pos[1]:.3f}, {final_ee_pos[2]:.3f}]")
@@ -1352,7 +1371,7 @@ class MuJoCoSimulator:
                     pos = obj_data["position"]
                     # initial_pos = None  # Reserved for future use
                     try:
-                        obj_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, obj_name)
+                        obj_id = self._body_ids.get(obj_name, -1)
                         if obj_id >= 0:
                             # Get initial position from motion_log
                             if result.get('motion_log', {}).get('initial_end_effector'):
@@ -1386,7 +1405,7 @@ class MuJoCoSimulator:
         else:
             logger.info(f"Simulation complete: {'SUCCESS' if validation['valid'] else 'FAILED'}")
             logger.info(f"  Contacts detected: {len(contacts)}")
-            logger.info(f"  Max force: {max(forces) if forces else 0:.2f}N")
+            logger.info(f"  Max force: {validation['max_force']:.2f}N")
             logger.info(f"  Validation: {validation['summary']}")
             logger.info(
                 f"  End-effector final position: [{final_ee_pos[0]:.3f}, {final_ee_pos[1]:.3f}, {final_ee_pos[2]:.3f}]")
@@ -2024,7 +2043,7 @@ class MuJoCoSimulator:
         mujoco.mj_forward(self.model, self.data)
         # Get end-effector body ID (gripper_moving_finger)
         try:
-            ee_body_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_moving_finger")
+            ee_body_id = self._body_ids.get("gripper_moving_finger", -1)
             if ee_body_id >= 0:
                 current_ee_pos = self.data.xpos[ee_body_id].copy()
             else:
@@ -2480,9 +2499,9 @@ class MuJoCoSimulator:
         """
         try:
             # Get gripper body IDs
-            gripper_static_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_static_finger")
-            gripper_moving_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, "gripper_moving_finger")
-            object_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_BODY, object_name)
+            gripper_static_id = self._body_ids.get("gripper_static_finger", -1)
+            gripper_moving_id = self._body_ids.get("gripper_moving_finger", -1)
+            object_id = self._body_ids.get(object_name, -1)
 
             if object_id < 0 or gripper_static_id < 0 or gripper_moving_id < 0:
                 return False
@@ -2574,9 +2593,9 @@ class MuJoCoSimulator:
     def _validate_simulation(
         self,
         action: Dict,
-        forces: List[float],
+        forces: np.ndarray,
         contacts: List[Dict],
-        trajectory: List[np.ndarray],
+        trajectory: np.ndarray,
         motion_params: Dict,
         gripper_contact_history: Optional[List[Dict]] = None,
         object_position_history: Optional[List[Dict]] = None,
@@ -2588,9 +2607,9 @@ class MuJoCoSimulator:
         
         Args:
             action: Original action dictionary
-            forces: List of contact forces over time
+            forces: Contact forces over time, shape (n_steps,)
             contacts: List of contact events
-            trajectory: Joint position trajectory
+            trajectory: Joint position trajectory, shape (n_steps, nq)
             motion_params: Motion parameters
             gripper_contact_history: History of gripper contact states (for pick/place)
             object_position_history: History of object positions (for pick/place)
@@ -2617,7 +2636,7 @@ class MuJoCoSimulator:
 
         # Check force levels
         desired_force = action.get("force", 5.0)
-        max_force = max(forces) if forces else 0.0
+        max_force = float(np.max(forces)) if len(forces) else 0.0
 
         # Convert action force (0-10 scale) to Newtons (rough approximation)
         desired_force_n = desired_force * 2.0  # Scale factor
@@ -2731,12 +2750,12 @@ class MuJoCoSimulator:
         if len(trajectory) > 1:
             # Check for large jumps in joint positions
             # Skip first few steps to allow for initial positioning
-            for i in range(max(1, len(trajectory) // 10), len(trajectory)):
-                diff = np.linalg.norm(trajectory[i] - trajectory[i-1])
-                if diff > 5.0:  # Very lenient threshold for demo
-                    motion_valid = False
-                    issues.append(f"Large motion jump at step {i}")
-                    break
+            start = max(1, len(trajectory) // 10)
+            steps = np.linalg.norm(np.diff(trajectory[start - 1:], axis=0), axis=1)
+            jumps = np.flatnonzero(steps > 5.0)  # Very lenient threshold for demo
+            if jumps.size:
+                motion_valid = False
+                issues.append(f"Large motion jump at step {start + int(jumps[0])}")
 
         # For demo purposes, be lenient - only fail if critical issues
         # In production, would be stricter
@@ -2893,3 +2912,42 @@ def simulate_actions_from_document(
         "results": results,
     }
 
+
+def simulate_actions_from_documents(
+    documents: List[Dict],
+    robot_model: str = "simple_arm",
+    output_dir: Optional[pathlib.Path] = None,
+    n_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Simulate actions from many documents in parallel.
+    
+    Actions within a document share simulator state (place continues from
+    the preceding pick), so each document runs sequentially on a single
+    worker and documents are sharded across processes.
+    
+    Args:
+        documents: Document dictionaries (see simulate_actions_from_document)
+        robot_model: Robot model to use
+        output_dir: Directory to save trajectory files
+        n_workers: Worker processes to shard documents across (defaults to
+            the CPU count; 1 simulates in this process)
+        
+    Returns:
+        List of per-document simulation results, in document order
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    simulate = functools.partial(
+        simulate_actions_from_document,
+        robot_model=robot_model,
+        output_dir=output_dir,
+    )
+    if n_workers <= 1 or len(documents) <= 1:
+        return [simulate(document) for document in documents]
+
+    # MuJoCo stepping is CPU-bound, so one process per core; only the
+    # documents and result dicts cross the process boundary
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(documents))) as pool:
+        return list(pool.map(simulate, documents))
@@ -0,0 +1,104 @@
+"""
+Unit tests for robot action extraction.
+"""
+
+import pickle
+
+from src.robot.action_extractor import (
+    ActionExtractor,
+    extract_actions_from_document,
+    extract_actions_from_documents,
+    iter_actions_from_document,
+)
+
+
+STEP = "Scrub the tile surface with a brush"
+
+
+class TestActionExtractorCache:
+    """Test the per-step field cache."""
+
+    def test_pickle_round_trip(self):
+        """Test that an extractor with a warm cache survives pickling."""
+        extractor = ActionExtractor(default_force=7.0, cache_size=128)
+        expected = extractor.extract_action(STEP)
+
+        restored = pickle.loads(pickle.dumps(extractor))
+        assert restored.default_force == 7.0
+        assert restored.cache_size == 128
+        assert restored.extract_action(STEP) == expected
+
+    def test_cache_respects_defaults(self):
+        """Test that changing the defaults after a cached extraction takes effect."""
+        extractor = ActionExtractor()
+        action = extractor.extract_action(STEP)
+        assert action["force"] == 5.0
+        assert action["duration"] == 30
+
+        extractor.default_force = 8.0
+        extractor.default_duration = 60
+        action = extractor.extract_action(STEP)
+        assert action["force"] == 8.0
+        assert action["duration"] == 60
+
+
+DOCUMENTS = [
+    {
+        "url": "https://example.com/tile",
+        "surface_type": "tile",
+        "dirt_type": "grease",
+        "cleaning_method": "scrubbing",
+        "steps": [STEP, "Rinse with warm water for 2 minutes", "ok"],
+    },
+    {
+        "url": "https://example.com/empty",
+        "steps": [],
+    },
+    {
+        "url": "https://example.com/glass",
+        "surface_type": "glass",
+        "steps": [
+            {"step": "Spray the glass cleaner on the window"},
+            {"step": "Wipe the glass with a microfiber cloth"},
+        ],
+    },
+]
+
+
+class TestDocumentExtraction:
+    """Test document-level extraction helpers."""
+
+    def test_extract_actions_from_documents_matches_per_document(self):
+        """Test that batch extraction concatenates per-document results in order."""
+        expected = []
+        for document in DOCUMENTS:
+            expected.extend(extract_actions_from_document(document))
+        assert [a["document_url"] for a in expected] == [
+            "https://example.com/tile",
+            "https://example.com/tile",
+            "https://example.com/glass",
+            "https://example.com/glass",
+        ]
+        assert expected[0]["surface_type"] == "tile"
+        assert expected[0]["dirt_type"] == "grease"
+        assert expected[2]["dirt_type"] == "unknown"
+
+        assert extract_actions_from_documents(DOCUMENTS, n_workers=1) == expected
+        assert extract_actions_from_documents(DOCUMENTS, n_workers=2) == expected
+
+    def test_iter_actions_matches_extract_actions(self):
+        """Test that the lazy step iterator yields what the list version returns."""
+        extractor = ActionExtractor()
+        steps = DOCUMENTS[0]["steps"]
+        assert list(extractor.iter_actions(steps)) == extractor.extract_actions(steps)
+
+    def test_iter_actions_from_document_matches_extract(self):
+        """Test that the lazy document iterator yields what the list version returns."""
+        for document in DOCUMENTS:
+            assert list(iter_actions_from_document(document)) == extract_actions_from_document(document)
+
+    def test_document_without_steps_yields_nothing(self):
+        """Test that documents with no steps produce no actions."""
+        assert list(iter_actions_from_document({"url": "https://example.com/none"})) == []
+        assert list(iter_actions_from_document(DOCUMENTS[1])) == []
+        assert list(ActionExtractor().iter_actions([])) == []
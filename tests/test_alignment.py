@@ -27,6 +27,18 @@ class TestAlignmentConfig:
         config = AlignmentConfig(min_clip_score=0.5)
         assert config.min_clip_score == 0.5
     
+    def test_compile_model_flag(self):
+        """Test torch.compile flag default and override."""
+        assert AlignmentConfig().compile_model is True
+        assert AlignmentConfig(compile_model=False).compile_model is False
+    
+    def test_backend_config(self):
+        """Test inference backend selection."""
+        assert AlignmentConfig().backend == "torch"
+        assert AlignmentConfig(backend="onnx").backend == "onnx"
+        with pytest.raises(Exception):
+            AlignmentConfig(backend="tensorflow")
+    
     def test_config_validation(self):
         """Test that invalid config values are rejected."""
         # Score > 1.0 should fail
@@ -146,6 +158,45 @@ class TestCLIPAlignmentScorer:
         assert isinstance(aligned, list)
         assert isinstance(misaligned, list)
     
+    def test_score_stats_normalization(self):
+        """Test cosine similarities are mapped to clamped [0, 1] scores."""
+        import numpy as np
+        
+        with patch('src.quality.alignment.CLIP_AVAILABLE', False):
+            scorer = CLIPAlignmentScorer(AlignmentConfig(min_clip_score=0.5))
+        
+        scores, stats = scorer._score_stats(np.array([-1.0, 0.0, 0.5, 1.2]))
+        
+        assert scores.tolist() == [0.0, 0.5, 0.75, 1.0]
+        assert [s["passed"] for s in stats] == [False, True, True, True]
+        assert stats[2]["score"] == 0.75
+        assert stats[0]["reason"].startswith("score_too_low")
+    
+    def test_score_stats_float32_input(self):
+        """Test float32 similarities (as produced by CLIP) round like the scalar path."""
+        import numpy as np
+        
+        with patch('src.quality.alignment.CLIP_AVAILABLE', False):
+            scorer = CLIPAlignmentScorer(AlignmentConfig(min_clip_score=0.2))
+        
+        cosine_sims = np.array([0.5024, -0.3, 0.1234567], dtype=np.float32)
+        scores, stats = scorer._score_stats(cosine_sims)
+        
+        for cosine_sim, score, stat in zip(cosine_sims, scores, stats):
+            expected = (float(cosine_sim) + 1.0) / 2.0
+            assert score == expected
+            assert stat["score"] == round(expected, 4)
+        assert stats[0]["score"] == 0.7512
+    
+    def test_image_buckets(self):
+        """Test the compiled-graph bucket sizes for image batches."""
+        with patch('src.quality.alignment.CLIP_AVAILABLE', False):
+            scorer = CLIPAlignmentScorer(AlignmentConfig(batch_size=32))
+            single = CLIPAlignmentScorer(AlignmentConfig(batch_size=1))
+        
+        assert scorer._image_buckets() == (1, 32)
+        assert single._image_buckets() == (1,)
+    
     @pytest.mark.skipif(not CLIP_AVAILABLE, reason="CLIP dependencies not available")
     def test_score_text_image_with_real_image(self):
         """Test scoring with a real image file (requires CLIP)."""
@@ -18,6 +18,7 @@ from src.config import (
     AlignmentConfig,
     ProcessingConfig,
     LoggingConfig,
+    OutputConfig,
     load_config,
     get_config,
     reload_config,
@@ -105,6 +106,7 @@ class TestImageQualityConfig:
         )
         assert config.min_resolution == [224, 224]
         assert config.max_aspect_ratio == 3.0
+        assert config.duplicate_hash_algorithm == "dhash"
     
     def test_image_quality_config_validation(self):
         """Test image quality config validation."""
@@ -149,6 +151,16 @@ class TestLoggingConfig:
             LoggingConfig(level="INVALID")  # Not a valid level
 
 
+class TestOutputConfig:
+    """Tests for OutputConfig model."""
+    
+    def test_raw_html_opt_in(self):
+        """Test that raw HTML storage is off by default."""
+        assert OutputConfig().keep_raw_html is False
+        assert Config().output.keep_raw_html is False
+        assert OutputConfig(keep_raw_html=True).keep_raw_html is True
+
+
 class TestConfigLoading:
     """Tests for config loading functions."""
     
@@ -153,6 +153,15 @@ class TestFormatFilter:
         result2 = filter_instance.filter_image(image_data)
         assert result2["passed"]
     
+    def test_format_alias_in_allow_list(self):
+        """Test that an allow-list naming only 'jpg' accepts .jpg and .jpeg."""
+        config = ImageQualityConfig(allowed_formats=["jpg", "png"])
+        filter_instance = ImageQualityFilter(config)
+        
+        assert filter_instance.check_format("images/img.jpg")[0]
+        assert filter_instance.check_format("images/img.jpeg")[0]
+        assert not filter_instance.check_format("images/img.gif")[0]
+    
     def test_format_from_path(self):
         """Test format detection from file path."""
         config = ImageQualityConfig(allowed_formats=["jpg", "jpeg", "png", "webp"])
@@ -297,6 +306,58 @@ class TestEdgeCases:
         assert result["stats"]["aspect_ratio"] == 1.0
 
 
+class TestBatchFiltering:
+    """Test vectorized batch filtering matches per-image filtering."""
+    
+    def test_filter_images_matches_filter_image(self):
+        """Test filter_images agrees with filter_image on mixed inputs."""
+        config = ImageQualityConfig(
+            min_resolution=[100, 100],
+            max_aspect_ratio=3.0,
+            allowed_formats=["jpg", "png"],
+            enable_duplicate_detection=False
+        )
+        filter_instance = ImageQualityFilter(config)
+        
+        images = [
+            {"width": 500, "height": 500, "path": "a.jpg"},
+            {"width": 50, "height": 500, "path": "b.jpg"},
+            {"width": 900, "height": 300, "path": "c.png"},
+            {"width": 901, "height": 300, "path": "d.png"},
+            {"width": None, "height": 20, "path": "e.jpg"},
+            {"width": 500, "height": 0, "path": "f.jpg"},
+            {"width": 500, "height": 500, "path": "g.gif"},
+            {"width": 500, "height": 500, "url": "http://example.com/h"},
+        ]
+        
+        passed, failed = filter_instance.filter_images(images)
+        
+        expected_passed = [img for img in images if filter_instance.filter_image(img)["passed"]]
+        assert passed == expected_passed
+        assert [f["filter_reason"] for f in failed] == [
+            filter_instance.filter_image(img)["reason"]
+            for img in images if not filter_instance.filter_image(img)["passed"]
+        ]
+
+
+    def test_filter_image_without_stats(self):
+        """Test collect_stats=False skips stats on pass but keeps them on failure."""
+        config = ImageQualityConfig(min_resolution=[100, 100])
+        filter_instance = ImageQualityFilter(config)
+        
+        passed = filter_instance.filter_image(
+            {"width": 500, "height": 500, "path": "a.jpg"}, collect_stats=False
+        )
+        assert passed == {"passed": True, "reason": "passed", "stats": None}
+        
+        failed = filter_instance.filter_image(
+            {"width": 50, "height": 500, "path": "a.jpg"}, collect_stats=False
+        )
+        assert not failed["passed"]
+        assert "resolution_too_small" in failed["reason"]
+        assert failed["stats"]["width"] == 50
+
+
 class TestDuplicateDetection:
     """Test duplicate image detection."""
     
@@ -392,3 +453,195 @@ class TestDuplicateDetection:
         assert len(failed) >= 1
         # Remaining should go through duplicate detection
         assert len(passed) >= 1
+    
+    def test_duplicate_detection_real_images(self, tmp_path):
+        """Test exact and near-duplicate detection on real image files."""
+        from PIL import Image, ImageDraw
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        def make_image(name, box, color):
+            img = Image.new("RGB", (256, 256), "white")
+            ImageDraw.Draw(img).rectangle(box, fill=color)
+            path = tmp_path / name
+            img.save(path)
+            return str(path)
+        
+        original = make_image("a.png", (20, 20, 120, 200), "black")
+        copy = make_image("b.png", (20, 20, 120, 200), "black")
+        different = make_image("c.png", (140, 40, 250, 100), "blue")
+        
+        config = ImageQualityConfig(
+            min_resolution=[100, 100],
+            enable_duplicate_detection=True,
+            duplicate_similarity_threshold=5
+        )
+        filter_instance = ImageQualityFilter(config)
+        
+        images = [
+            {"width": 256, "height": 256, "path": original, "url": "http://example.com/a.png"},
+            {"width": 256, "height": 256, "path": different, "url": "http://example.com/c.png"},
+            {"width": 256, "height": 256, "path": copy, "url": "http://example.com/b.png"},
+        ]
+        
+        passed, failed = filter_instance.filter_images(images)
+        
+        assert [img["url"] for img in passed] == ["http://example.com/a.png", "http://example.com/c.png"]
+        assert len(failed) == 1
+        assert failed[0]["duplicate_of"] == "http://example.com/a.png"
+        assert failed[0]["hamming_distance"] == 0
+        assert "duplicate_image" in failed[0]["filter_reason"]
+    
+    def test_packed_hamming_distance_matches_imagehash(self):
+        """Test packed uint64 Hamming distance equals ImageHash subtraction."""
+        import numpy as np
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE, _hash_to_uint64, _popcount
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        import imagehash
+        
+        hash_a = imagehash.hex_to_hash("ffd8a1b2c3d4e5f6")
+        hash_b = imagehash.hex_to_hash("0fd8a1b2c3d4e5f7")
+        packed = np.array([_hash_to_uint64(hash_a), _hash_to_uint64(hash_a)])
+        
+        distances = _popcount(packed ^ _hash_to_uint64(hash_b))
+        assert distances.tolist() == [hash_a - hash_b] * 2
+    
+    def test_duplicate_detection_large_jpeg(self, tmp_path):
+        """Test a large JPEG is matched to the same picture saved as PNG."""
+        from PIL import Image, ImageDraw
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        img = Image.new("RGB", (2048, 1536), "white")
+        ImageDraw.Draw(img).rectangle((200, 200, 1200, 1300), fill="black")
+        img.save(tmp_path / "large.jpg", quality=90)
+        img.resize((512, 384)).save(tmp_path / "small.png")
+        
+        config = ImageQualityConfig(min_resolution=[100, 100], duplicate_similarity_threshold=5)
+        filter_instance = ImageQualityFilter(config)
+        
+        images = [
+            {"width": 2048, "height": 1536, "path": str(tmp_path / "large.jpg"), "url": "http://example.com/large.jpg"},
+            {"width": 512, "height": 384, "path": str(tmp_path / "small.png"), "url": "http://example.com/small.png"},
+        ]
+        
+        passed, failed = filter_instance.filter_images(images)
+        assert len(passed) == 1
+        assert failed[0]["duplicate_of"] == "http://example.com/large.jpg"
+
+    def test_hash_cache_reused_across_instances(self, tmp_path):
+        """Test hashes stored in the on-disk cache are reused on the next run."""
+        from PIL import Image, ImageDraw
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        img = Image.new("RGB", (300, 300), "white")
+        ImageDraw.Draw(img).ellipse((50, 50, 250, 250), fill="black")
+        img.save(tmp_path / "img.png")
+        images = [{"width": 300, "height": 300, "path": str(tmp_path / "img.png")}]
+        
+        config = ImageQualityConfig(hash_cache_path=str(tmp_path / "hashes.sqlite"))
+        first = ImageQualityFilter(config)._compute_hashes(images)
+        
+        warm = ImageQualityFilter(config)
+        warm._compute_image_hash_obj = lambda path: pytest.fail("hash recomputed")
+        second = warm._compute_hashes(images)
+        
+        assert first[0] is not None
+        assert second[0] == first[0]
+
+    def test_hash_cache_disabled_by_default(self):
+        """Test the on-disk hash cache is opt-in."""
+        assert ImageQualityConfig().hash_cache_path is None
+        assert ImageQualityFilter(ImageQualityConfig())._hash_cache is None
+
+    def test_hash_cache_close(self, tmp_path):
+        """Test close() releases the SQLite connection and is idempotent."""
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        config = ImageQualityConfig(hash_cache_path=str(tmp_path / "hashes.sqlite"))
+        with ImageQualityFilter(config) as filter_instance:
+            assert filter_instance._hash_cache is not None
+        assert filter_instance._hash_cache is None
+        filter_instance.close()
+
+    def test_hash_cache_key_includes_version(self, tmp_path):
+        """Test cache keys carry the decode/hash version tag."""
+        from src.quality.image_filters import HASH_CACHE_VERSION
+        
+        (tmp_path / "img.png").write_bytes(b"x")
+        key = ImageQualityFilter(ImageQualityConfig())._hash_cache_key(str(tmp_path / "img.png"))
+        assert key.endswith(f":dhash:v{HASH_CACHE_VERSION}")
+
+    def test_first_match_matches_numpy(self):
+        """Test the duplicate scan kernel agrees with the NumPy reference."""
+        import numpy as np
+        from src.quality.image_filters import _first_match, _first_match_numpy
+        
+        rng = np.random.default_rng(0)
+        seen = rng.integers(0, 2**63, size=64, dtype=np.uint64)
+        for _ in range(20):
+            packed = np.uint64(seen[rng.integers(0, 64)] ^ np.uint64(1 << int(rng.integers(0, 63))))
+            for threshold in (0, 1, 5):
+                assert _first_match(seen, 64, packed, threshold) == _first_match_numpy(seen, 64, packed, threshold)
+        assert _first_match(seen, 0, seen[0], 5) == (-1, 0)
+
+    def test_exact_threshold_only_matches_identical_hashes(self, tmp_path):
+        """Test threshold=0 flags identical images but keeps near-duplicates."""
+        from PIL import Image, ImageDraw
+        from src.quality.image_filters import IMAGEHASH_AVAILABLE
+        
+        if not IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        img = Image.new("RGB", (256, 256), "white")
+        ImageDraw.Draw(img).rectangle((40, 40, 200, 200), fill="black")
+        img.save(tmp_path / "a.png")
+        img.save(tmp_path / "a_copy.png")
+        ImageDraw.Draw(img).rectangle((0, 0, 60, 255), fill="gray")
+        img.save(tmp_path / "b.png")
+        
+        config = ImageQualityConfig(min_resolution=[100, 100], duplicate_similarity_threshold=0)
+        filter_instance = ImageQualityFilter(config)
+        images = [
+            {"width": 256, "height": 256, "path": str(tmp_path / name), "url": f"http://example.com/{name}"}
+            for name in ("a.png", "b.png", "a_copy.png")
+        ]
+        
+        unique, duplicates = filter_instance._detect_duplicates(images)
+        assert [image["url"] for image in unique] == ["http://example.com/a.png", "http://example.com/b.png"]
+        assert duplicates[0]["duplicate_of"] == "http://example.com/a.png"
+        assert duplicates[0]["hamming_distance"] == 0
+
+    def test_detect_duplicates_accepts_generator(self, tmp_path):
+        """Test duplicate detection consumes a generator across several chunks."""
+        from PIL import Image
+        from src.quality import image_filters
+        
+        if not image_filters.IMAGEHASH_AVAILABLE:
+            pytest.skip("imagehash not available")
+        
+        Image.new("RGB", (256, 256), "white").save(tmp_path / "white.png")
+        config = ImageQualityConfig(min_resolution=[100, 100])
+        filter_instance = ImageQualityFilter(config)
+        n_images = image_filters.DEDUP_CHUNK_SIZE + 3
+        images = (
+            {"width": 256, "height": 256, "path": str(tmp_path / "white.png"), "url": f"http://example.com/{i}.png"}
+            for i in range(n_images)
+        )
+        
+        unique, duplicates = filter_instance._detect_duplicates(images)
+        assert len(unique) == 1
+        assert len(duplicates) == n_images - 1
+        assert all(d["duplicate_of"] == "http://example.com/0.png" for d in duplicates)
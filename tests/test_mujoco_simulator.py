@@ -0,0 +1,39 @@
+"""
+Unit tests for the MuJoCo simulator.
+"""
+
+import pytest
+
+pytest.importorskip("mujoco")
+
+from src.robot.mujoco_simulator import simulate_actions_from_documents
+
+
+DOCUMENTS = [
+    {
+        "url": "https://example.com/scrub",
+        "robot_actions": [
+            {"action_type": "scrub", "duration": 0.05, "pattern": "circular"},
+        ],
+    },
+    {
+        "url": "https://example.com/wipe",
+        "robot_actions": [
+            {"action_type": "wipe", "duration": 0.05},
+            {"action_type": "wait", "duration": 0.05},
+        ],
+    },
+]
+
+
+class TestSimulateDocuments:
+    """Test batch simulation across documents."""
+
+    def test_parallel_matches_serial(self):
+        """Test that sharding documents across workers keeps results and order."""
+        serial = simulate_actions_from_documents(DOCUMENTS, n_workers=1)
+        parallel = simulate_actions_from_documents(DOCUMENTS, n_workers=2)
+
+        assert [r["num_actions"] for r in serial] == [1, 2]
+        assert all(r["success"] for r in serial)
+        assert parallel == serial
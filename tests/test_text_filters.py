@@ -154,6 +154,21 @@ class TestLanguageFilter:
         # Should pass because text is too short for reliable detection
         assert result[0]  # Should pass
         assert "text_too_short" in result[1].get("reason", "")
+    
+    def test_language_detection_truncates_long_text(self):
+        """Test that only the first language_detection_max_words words are detected on."""
+        config = TextQualityConfig(language="en", language_detection_max_words=20)
+        filter_instance = TextQualityFilter(config)
+        if not filter_instance._langdetect_available:
+            pytest.skip("no language detector available")
+        
+        seen = []
+        filter_instance._detect_language = lambda text: seen.append(text) or "en"
+        passed, stats = filter_instance.check_language("cleaning the kitchen floor " * 50)
+        
+        assert passed
+        assert stats["detected_language"] == "en"
+        assert len(seen[0].split()) == 20
 
 
 class TestCombinedFilters:
@@ -262,11 +277,90 @@ class TestEdgeCases:
         result = filter_instance.filter(text)
         # Should not crash, may or may not pass depending on word count
         assert "word_count" in result["stats"]
+    
+    def test_ascii_fast_path_matches_regex(self):
+        """Test the ASCII tokenizer fast path splits exactly like the word regex."""
+        from src.quality.text_filters import _WORD_RE
+        
+        filter_instance = TextQualityFilter(TextQualityConfig())
+        text = "".join(chr(c) for c in range(128)) + " Don't stop_now, 10x-faster! tab\tend\n"
+        assert text.isascii()
+        assert filter_instance._split_words(text) == _WORD_RE.findall(text.lower())
+    
+    def test_re2_backend_matches_stdlib_tokens(self):
+        """Test the re2 tokenizer backend splits words like stdlib re."""
+        from src.quality.text_filters import RE2_AVAILABLE
+        
+        if not RE2_AVAILABLE:
+            pytest.skip("google-re2 not available")
+        
+        text = "Café résumé, naïve_user: 10 items! Don't stop."
+        stdlib = TextQualityFilter(TextQualityConfig(regex_backend="re"))
+        re2_filter = TextQualityFilter(TextQualityConfig(regex_backend="re2"))
+        assert re2_filter._split_words(text) == stdlib._split_words(text)
 
 
 class TestFilterStatistics:
     """Test that filter returns comprehensive statistics."""
     
+    def test_filter_result_cache_for_duplicate_text(self):
+        """Test identical documents are served from the result cache."""
+        config = TextQualityConfig(min_words=5, max_words=1000, filter_cache_size=2)
+        filter_instance = TextQualityFilter(config)
+        text = "Clean the carpet with a vacuum, then apply a gentle stain remover."
+        
+        first = filter_instance.filter(text)
+        first["stats"]["word_count"] = -1  # Caller mutations must not leak into the cache
+        filter_instance._split_words = lambda t: pytest.fail("cached text was re-tokenized")
+        second = filter_instance.filter("  " + text + "\n")
+        
+        assert second["passed"] == first["passed"]
+        assert second["stats"]["word_count"] > 0
+    
+    def test_filter_batch_matches_filter(self):
+        """Test that filter_batch returns the same results as filter(), in order."""
+        config = TextQualityConfig(min_words=5, max_words=40, min_text_length_for_repetition_check=5)
+        filter_instance = TextQualityFilter(config)
+        texts = [
+            "Clean the carpet with a vacuum, then apply a gentle stain remover.",
+            "",
+            "too short",
+            "word " * 60,
+            "Rinse the sink with warm water and wipe the tap with a soft cloth.",
+        ]
+        
+        assert filter_instance.filter_batch(texts) == [filter_instance.filter(t) for t in texts]
+    
+    def test_filter_batch_parallel_matches_serial(self):
+        """Test that filter_batch with worker processes keeps results and order."""
+        config = TextQualityConfig(min_words=5, max_words=40, min_text_length_for_repetition_check=5)
+        filter_instance = TextQualityFilter(config)
+        texts = [
+            "Clean the carpet with a vacuum, then apply a gentle stain remover.",
+            "too short",
+            "word " * 60,
+        ] * 4
+        
+        assert filter_instance.filter_batch(texts, n_workers=2) == filter_instance.filter_batch(texts)
+    
+    def test_filter_tokenizes_once(self):
+        """Test that filter() splits the text into words only once."""
+        config = TextQualityConfig(min_words=5, max_words=1000, min_text_length_for_repetition_check=5)
+        filter_instance = TextQualityFilter(config)
+        original_split = filter_instance._split_words
+        calls = []
+        
+        def counting_split(text):
+            calls.append(text)
+            return original_split(text)
+        
+        filter_instance._split_words = counting_split
+        text = "Clean the carpet with a vacuum, then apply a gentle stain remover and let it dry. " * 3
+        result = filter_instance.filter(text)
+        
+        assert "word_count" in result["stats"]
+        assert len(calls) == 1
+    
     def test_stats_include_all_metrics(self):
         """Test that passed filter includes all statistics."""
         config = TextQualityConfig(
@@ -428,6 +522,42 @@ class TestRepetitionFilter:
             # Check if repetition was skipped
             assert stats.get("repetition_check_skipped") or "repetition" not in result.get("reason", "").lower()
     
+    def test_ngram_counts_match_counter(self):
+        """Test hashed n-gram counting agrees with counting the phrases directly."""
+        import random
+        from collections import Counter
+        
+        rng = random.Random(0)
+        vocab = ["clean", "the", "sink", "with", "soap", "rinse", "dry"]
+        words = [rng.choice(vocab) for _ in range(300)]
+        filter_instance = TextQualityFilter(TextQualityConfig(ngram_size=3, verbose_stats=True))
+        
+        max_repetition, stats = filter_instance._check_ngram_repetition("", words)
+        
+        expected = Counter(" ".join(words[i:i + 3]) for i in range(len(words) - 2))
+        phrase, count = expected.most_common(1)[0]
+        assert max_repetition == count
+        assert stats["unique_ngrams"] == len(expected)
+        assert stats["most_repeated_ngram"] == phrase
+    
+    def test_repetition_diagnostics_only_when_verbose_or_failed(self):
+        """Test detailed repetition stats are skipped for passing text unless verbose_stats."""
+        text = " ".join(f"distinct{i} cleaning{i} method{i}" for i in range(30))
+        
+        compact = TextQualityFilter(TextQualityConfig())
+        _, stats = compact._check_word_repetition(text)
+        assert "word_repetition_ratio" in stats
+        assert "most_repeated_word" not in stats
+        
+        verbose = TextQualityFilter(TextQualityConfig(verbose_stats=True))
+        _, stats = verbose._check_word_repetition(text)
+        assert "most_repeated_word" in stats
+        
+        repetitive = " ".join(["vacuum carpet thoroughly"] * 20)
+        ratio, stats = compact._check_word_repetition(repetitive)
+        assert ratio > compact.config.max_word_repetition_ratio
+        assert stats["most_repeated_word"] in {"vacuum", "carpet", "thoroughly"}
+    
     def test_repetition_stats_included(self):
         """Test that repetition check includes detailed statistics."""
         config = TextQualityConfig(
@@ -508,6 +638,14 @@ class TestPerplexityFilter:
         # May be "text_too_short" if model was available, or "kenlm_model_not_available" if not
         assert "text_too_short" in reason or "kenlm_model_not_available" in reason or "perplexity_filter_disabled" in reason
     
+    def test_short_text_prescreen_is_conservative(self):
+        """Test the character-length pre-screen never rejects text with enough words."""
+        from src.quality.text_filters import _cannot_have_words
+        
+        assert not _cannot_have_words("a b c", 3)
+        assert _cannot_have_words("ab c", 3)
+        assert not _cannot_have_words("", 0)
+    
     def test_perplexity_filter_integration(self):
         """Test perplexity filter integration with main filter (when model not available)."""
         config = TextQualityConfig(
@@ -0,0 +1,29 @@
+"""
+Unit tests for text processor helpers.
+"""
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("trafilatura")
+
+from src.processors.text_processor import infer_source_type
+
+
+class TestInferSourceType:
+    """Test URL -> source type inference."""
+    
+    def test_known_domains(self):
+        """Test each source type is recognized from its domains."""
+        assert infer_source_type("https://puffy.com/blogs/how-to-wash-pillows") == "pillows_bedding"
+        assert infer_source_type("https://www.ariel.in/en-in/how-to-wash") == "clothes"
+        assert infer_source_type("https://floorworld.com.au/carpet-care") == "carpets_floors"
+    
+    def test_unknown_domain(self):
+        """Test URLs without a known domain are unknown."""
+        assert infer_source_type("https://example.com/cleaning") == "unknown"
+    
+    def test_category_priority_over_position(self):
+        """Test a URL with domains of two types resolves by type priority, not match position."""
+        assert infer_source_type("https://vanish.co.in/?ref=puffy.com") == "pillows_bedding"
+        assert infer_source_type("https://spincycles.in/?ref=whirlpool.com") == "clothes"